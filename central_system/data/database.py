@@ -8,8 +8,10 @@ It handles connections to Firebase and provides methods for CRUD operations.
 """
 
 import os
+import re
 import json
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta
 import threading
 import hashlib
 import pytz
@@ -25,6 +27,36 @@ try:
 except ImportError:
     FIREBASE_AVAILABLE = False
 
+# Fractional seconds of an ISO timestamp; fromisoformat takes only 3 or 6 digits
+_ISO_FRACTION_RE = re.compile(r'\.(\d+)')
+
+def to_naive_local(value):
+    """
+    Convert a timestamp to a naive local datetime for comparison.
+    
+    Status history timestamps are written by different clients, so they may
+    or may not carry a timezone ('Z' or an offset) or fractional seconds.
+    
+    Args:
+        value: ISO 8601 string or datetime
+        
+    Returns:
+        datetime: Naive local time, or None if the value is not a timestamp
+    """
+    if isinstance(value, str):
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        value = _ISO_FRACTION_RE.sub(lambda m: '.' + (m.group(1) + '00000')[:6], value, count=1)
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
 class DatabaseManager(QObject):
     """
     Database manager for Firebase Firestore.
@@ -56,6 +88,16 @@ class DatabaseManager(QObject):
         self.monitoring_thread = None
         self.monitoring_running = False
         
+        # Audit log result sets by ID: total count plus page cursors (Firestore) or rows (simulation)
+        self._audit_queries = {}
+        
+        # Last faculty document of each page served by search_faculty, by
+        # (department, status, offset of the next page)
+        self._faculty_cursors = {}
+        
+        # Bumped by every faculty write made through this manager
+        self._faculty_change_token = 0
+        
         # Initialize Firebase
         self._initialize_firebase()
         
@@ -513,6 +555,19 @@ class DatabaseManager(QObject):
             self.logger.error(f"Error updating student: {e}")
             return False
             
+    def faculty_change_token(self):
+        """
+        Get a token that changes whenever faculty data is written through this manager.
+        
+        Callers can keep a faculty list loaded at one token and reuse it
+        while the token is unchanged. Writes made by other processes are
+        not reflected.
+        
+        Returns:
+            int: Change token
+        """
+        return self._faculty_change_token
+        
     def get_all_faculty(self, department=None, status=None):
         """
         Get all faculty members, optionally filtered by department and/or status.
@@ -561,6 +616,84 @@ class DatabaseManager(QObject):
             self.logger.error(f"Error getting faculty: {e}")
             return []
             
+    def search_faculty(self, dept=None, status=None, q=None, limit=200, offset=0):
+        """
+        Get one page of faculty members matching the given filters.
+        
+        Department and status are applied as equality filters in the query.
+        Without search text, Firestore returns just the page, ordered by
+        document ID and continuing after the previous page's last document
+        when known. Firestore has no substring matching, so with search text
+        the filtered faculty are fetched and matched on name and email.
+        
+        Args:
+            dept (str, optional): Department to include, all departments if None
+            status (str, optional): Status to include, all statuses if None
+            q (str, optional): Text to find in the name or email, case-insensitive
+            limit (int, optional): Maximum number of faculty to return
+            offset (int, optional): Index of the first faculty member to return
+            
+        Returns:
+            list: List of faculty data
+        """
+        self.logger.info(f"Searching faculty (department: {dept}, status: {status}, search: {q})")
+        
+        needle = q.lower() if q else None
+        
+        try:
+            faculty_list = []
+            
+            if self.db and self.connected:
+                # Use Firestore
+                faculty_ref = self.db.collection('faculty')
+                if dept:
+                    faculty_ref = faculty_ref.where('department', '==', dept)
+                if status:
+                    faculty_ref = faculty_ref.where('status', '==', status)
+                    
+                if needle:
+                    docs = faculty_ref.get()
+                else:
+                    # Fetch only the page; continue after the last document
+                    # of the previous page when known
+                    query = faculty_ref.order_by('__name__')
+                    cursor = self._faculty_cursors.get((dept, status, offset))
+                    page = query.start_after(cursor) if cursor else query.offset(offset)
+                    docs = list(page.limit(limit).get())
+                    if docs:
+                        self._faculty_cursors[(dept, status, offset + len(docs))] = docs[-1]
+                        while len(self._faculty_cursors) > 64:
+                            self._faculty_cursors.pop(next(iter(self._faculty_cursors)))
+                            
+                for doc in docs:
+                    faculty_data = doc.to_dict()
+                    faculty_data['id'] = doc.id
+                    faculty_list.append(faculty_data)
+                    
+                if not needle:
+                    return faculty_list
+            else:
+                # Use simulation DB
+                for faculty in self.simulation_db['faculty'].values():
+                    if dept and faculty.get('department') != dept:
+                        continue
+                    if status and faculty.get('status') != status:
+                        continue
+                    faculty_list.append(faculty.copy())
+                    
+            if needle:
+                faculty_list = [
+                    faculty for faculty in faculty_list
+                    if needle in faculty.get('name', '').lower()
+                    or needle in faculty.get('email', '').lower()
+                ]
+                
+            return faculty_list[offset:offset + limit]
+            
+        except Exception as e:
+            self.logger.error(f"Error searching faculty: {e}")
+            return []
+            
     def add_faculty(self, faculty_data):
         """
         Add a new faculty member.
@@ -595,6 +728,7 @@ class DatabaseManager(QObject):
                 faculty_id = faculty_data.get('id') or f"faculty{len(self.simulation_db['faculty']) + 1:03d}"
             faculty_data['id'] = faculty_id
             self.simulation_db['faculty'][faculty_id] = faculty_data
+            self._faculty_change_token += 1
             
             # Emit data changed signal
             self.data_changed.emit('faculty', faculty_id)
@@ -632,6 +766,7 @@ class DatabaseManager(QObject):
                 else:
                     faculty_data['id'] = faculty_id
                     self.simulation_db['faculty'][faculty_id] = faculty_data
+            self._faculty_change_token += 1
             
             # Emit data changed signal
             self.data_changed.emit('faculty', faculty_id)
@@ -662,6 +797,7 @@ class DatabaseManager(QObject):
                 # Use simulation DB
                 if faculty_id in self.simulation_db['faculty']:
                     del self.simulation_db['faculty'][faculty_id]
+            self._faculty_change_token += 1
             
             # Emit data changed signal
             self.data_changed.emit('faculty', faculty_id)
@@ -671,6 +807,60 @@ class DatabaseManager(QObject):
             self.logger.error(f"Error deleting faculty: {e}")
             return False
             
+    def get_faculty_history(self, faculty_id, start=None, end=None, status=None, offset=0, limit=500):
+        """
+        Get one page of a faculty member's status history matching the given filters, newest first.
+        
+        Status history is stored on the faculty document, so only that field
+        is fetched. Timestamps are compared as naive local times, whatever
+        timezone suffix or precision each one was written with; entries
+        without a valid timestamp are skipped.
+        
+        Args:
+            faculty_id (str): Faculty ID
+            start (datetime, optional): Earliest timestamp to include
+            end (datetime, optional): Latest timestamp to include
+            status (str, optional): Status to include, all statuses if None
+            offset (int, optional): Index of the first entry of the page
+            limit (int, optional): Maximum number of entries to return
+            
+        Returns:
+            list: List of status history entries
+        """
+        self.logger.info(f"Getting status history for faculty: {faculty_id}")
+        
+        start = to_naive_local(start) if start else None
+        end = to_naive_local(end) if end else None
+        
+        try:
+            if self.db and self.connected:
+                # Use Firestore, fetching only the history field
+                doc = self.db.collection('faculty').document(faculty_id).get(field_paths=['status_history'])
+                history = (doc.to_dict() or {}).get('status_history', []) if doc.exists else []
+            else:
+                # Use simulation DB
+                history = self.simulation_db['faculty'].get(faculty_id, {}).get('status_history', [])
+                
+            matches = []
+            for entry in history:
+                if status and entry.get('status') != status:
+                    continue
+                timestamp = to_naive_local(entry.get('timestamp'))
+                if timestamp is None:
+                    continue
+                if start and timestamp < start:
+                    continue
+                if end and timestamp > end:
+                    continue
+                matches.append((timestamp, entry))
+                
+            matches.sort(key=lambda match: match[0], reverse=True)
+            return [entry for _, entry in matches[offset:offset + limit]]
+            
+        except Exception as e:
+            self.logger.error(f"Error getting faculty history: {e}")
+            return []
+            
     def add_consultation_request(self, request_data):
         """
         Add a new consultation request.
@@ -860,6 +1050,54 @@ class DatabaseManager(QObject):
             self.logger.error(f"Error adding audit log: {e}")
             return None
             
+    def add_audit_logs_bulk(self, logs):
+        """
+        Add several audit log entries at once.
+        
+        On Firestore the entries are written in batched commits of up to
+        500 documents, one round-trip per commit.
+        
+        Args:
+            logs (list): List of log data dicts
+            
+        Returns:
+            list: Log IDs in the same order, None for entries that failed
+        """
+        self.logger.info(f"Adding {len(logs)} audit log entries")
+        
+        log_ids = [None] * len(logs)
+        
+        try:
+            for log_data in logs:
+                log_data.setdefault('timestamp', datetime.now().isoformat())
+                
+            if self.db and self.connected:
+                # Use Firestore, committing at most 500 writes per batch
+                collection = self.db.collection('audit_log')
+                for start in range(0, len(logs), 500):
+                    batch = self.db.batch()
+                    chunk_ids = []
+                    for log_data in logs[start:start + 500]:
+                        doc_ref = collection.document()
+                        batch.set(doc_ref, log_data)
+                        chunk_ids.append(doc_ref.id)
+                    batch.commit()
+                    log_ids[start:start + len(chunk_ids)] = chunk_ids
+            else:
+                # Use simulation DB
+                first = len(self.simulation_db['audit_log']) + 1
+                log_ids = [f"log{first + i:05d}" for i in range(len(logs))]
+                
+        except Exception as e:
+            self.logger.error(f"Error adding audit logs: {e}")
+            
+        for log_id, log_data in zip(log_ids, logs):
+            if log_id:
+                log_data['id'] = log_id
+                self.simulation_db['audit_log'][log_id] = log_data
+                
+        return log_ids
+        
     def get_audit_logs(self, limit=50):
         """
         Get audit log entries.
@@ -897,6 +1135,85 @@ class DatabaseManager(QObject):
             self.logger.error(f"Error getting audit logs: {e}")
             return []
             
+    def query_audit_logs(self, actions=None, date=None, offset=0, limit=300, cache_id=None):
+        """
+        Get one page of audit log entries matching the given filters, newest first.
+        
+        Filters are pushed into the query, with the date as a half-open
+        timestamp range. On Firestore the action and date filters together
+        need a composite index on (action, timestamp DESC). Passing back the
+        returned cache_id reuses the count and page cursors of the earlier
+        call, so paging does not re-run the count or skip over earlier pages.
+        
+        Args:
+            actions (list, optional): Action names to include, all actions if None
+            date (date, optional): Day to include, all days if None
+            offset (int, optional): Index of the first entry of the page
+            limit (int, optional): Maximum number of entries to return
+            cache_id (str, optional): Result-set ID returned by a previous call with the same filters
+            
+        Returns:
+            tuple: (total count, result-set ID, list of log entries)
+        """
+        self.logger.info(f"Querying audit logs (offset: {offset}, limit: {limit})")
+        
+        # ISO timestamps compare correctly as strings
+        start = end = None
+        if date is not None:
+            start = date.isoformat()
+            end = (date + timedelta(days=1)).isoformat()
+            
+        try:
+            cached = self._audit_queries.get(cache_id)
+            
+            if self.db and self.connected:
+                # Use Firestore
+                query = self.db.collection('audit_log')
+                if actions:
+                    query = query.where('action', 'in', list(actions))
+                if start:
+                    query = query.where('timestamp', '>=', start).where('timestamp', '<', end)
+                query = query.order_by('timestamp', direction=firestore.Query.DESCENDING)
+                
+                if cached is None:
+                    cached = {'total': query.count().get()[0][0].value, 'cursors': {}}
+                    
+                # Continue after the last document of the previous page when known
+                cursor = cached['cursors'].get(offset)
+                page = query.start_after(cursor) if cursor else query.offset(offset)
+                docs = list(page.limit(limit).get())
+                if docs:
+                    cached['cursors'][offset + len(docs)] = docs[-1]
+                    
+                log_list = []
+                for doc in docs:
+                    log_data = doc.to_dict()
+                    log_data['id'] = doc.id
+                    log_list.append(log_data)
+            else:
+                # Use simulation DB
+                if cached is None:
+                    logs = [log for log in self.simulation_db['audit_log'].values()
+                            if (not actions or log.get('action') in actions)
+                            and (start is None or start <= log.get('timestamp', '') < end)]
+                    logs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+                    cached = {'total': len(logs), 'rows': logs}
+                    
+                log_list = cached['rows'][offset:offset + limit]
+                
+            # Remember new result sets, keeping only the most recent few
+            if cache_id not in self._audit_queries:
+                cache_id = uuid.uuid4().hex
+                self._audit_queries[cache_id] = cached
+                while len(self._audit_queries) > 8:
+                    self._audit_queries.pop(next(iter(self._audit_queries)))
+                    
+            return cached['total'], cache_id, log_list
+            
+        except Exception as e:
+            self.logger.error(f"Error querying audit logs: {e}")
+            return 0, None, []
+            
     def verify_admin_login(self, username, password):
         """
         Verify admin login credentials.
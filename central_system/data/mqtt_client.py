@@ -22,6 +22,30 @@ try:
 except ImportError:
     MQTT_AVAILABLE = False
 
+# Use orjson for payload serialization when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps(data):
+    """
+    Serialize a payload to JSON.
+    
+    orjson encodes datetime and UUID values (e.g. database rows) natively in C;
+    the stdlib fallback stringifies them.
+    
+    Args:
+        data (dict or list): Payload data
+        
+    Returns:
+        bytes or str: JSON payload
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, default=str)
+
 class MQTTClient(QObject):
     """
     MQTT client for communication with faculty desk units.
@@ -497,16 +521,16 @@ class MQTTClient(QObject):
         
         Args:
             topic (str): MQTT topic
-            payload (str or dict): Message payload
+            payload (str, dict or list): Message payload
             qos (int, optional): Quality of Service level
             retain (bool, optional): Whether the message should be retained
             
         Returns:
             bool: True if the message was published successfully
         """
-        # Convert dict payload to JSON string
-        if isinstance(payload, dict):
-            payload = json.dumps(payload)
+        # Convert dict/list payload (e.g. database rows) to JSON
+        if isinstance(payload, (dict, list)):
+            payload = _dumps(payload)
             
         # If not connected, queue the message for later
         if not self.connected or not self.client:
@@ -13,8 +13,8 @@ import json
 import hashlib
 import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
-import uuid
 
 from PyQt6.QtCore import QObject, pyqtSignal
 from utils.logger import get_logger
@@ -30,6 +30,130 @@ except ImportError:
 # Import base adapter class
 from central_system.database_adapter import DatabaseAdapter
 
+# Schema created on connect. Sent as a single multi-statement execute so
+# initialization costs one round-trip instead of one per table.
+SCHEMA_DDL = """
+-- pgcrypto provides gen_random_uuid() for key defaults
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+-- Faculty table
+CREATE TABLE IF NOT EXISTS faculty (
+    faculty_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    name VARCHAR(100) NOT NULL,
+    department VARCHAR(100) NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    phone VARCHAR(20),
+    office VARCHAR(50),
+    ble_beacon_id VARCHAR(50),
+    status VARCHAR(20) DEFAULT 'unavailable',
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Students table
+CREATE TABLE IF NOT EXISTS students (
+    student_id VARCHAR(50) PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    department VARCHAR(100) NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    rfid_id VARCHAR(50) UNIQUE,
+    last_login TIMESTAMP
+);
+
+-- Offices table
+CREATE TABLE IF NOT EXISTS offices (
+    office_id VARCHAR(50) PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    building VARCHAR(100) NOT NULL,
+    floor INTEGER DEFAULT 1,
+    room VARCHAR(20) NOT NULL,
+    ble_beacon_id VARCHAR(50),
+    status VARCHAR(20) DEFAULT 'active',
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Consultation requests table
+CREATE TABLE IF NOT EXISTS consultation_requests (
+    request_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    student_id VARCHAR(50) NOT NULL REFERENCES students(student_id),
+    faculty_id UUID NOT NULL REFERENCES faculty(faculty_id),
+    subject VARCHAR(200) NOT NULL,
+    message TEXT,
+    status VARCHAR(20) DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Consultations table
+CREATE TABLE IF NOT EXISTS consultations (
+    consultation_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    request_id UUID REFERENCES consultation_requests(request_id),
+    student_id VARCHAR(50) NOT NULL REFERENCES students(student_id),
+    faculty_id UUID NOT NULL REFERENCES faculty(faculty_id),
+    subject VARCHAR(200) NOT NULL,
+    start_time TIMESTAMP,
+    end_time TIMESTAMP,
+    notes TEXT,
+    status VARCHAR(20) DEFAULT 'scheduled',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Admin users table
+CREATE TABLE IF NOT EXISTS admin_users (
+    admin_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    username VARCHAR(50) UNIQUE NOT NULL,
+    password_hash VARCHAR(128) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    role VARCHAR(20) DEFAULT 'admin',
+    last_login TIMESTAMP
+);
+
+-- Audit log table
+CREATE TABLE IF NOT EXISTS audit_logs (
+    log_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id VARCHAR(50),
+    action VARCHAR(50) NOT NULL,
+    entity_type VARCHAR(50) NOT NULL,
+    entity_id VARCHAR(50),
+    details JSONB,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Serves per-faculty request listings, newest first
+CREATE INDEX IF NOT EXISTS idx_requests_faculty_created
+    ON consultation_requests (faculty_id, created_at DESC);
+
+-- Serve faculty searches filtered by department or status
+CREATE INDEX IF NOT EXISTS idx_faculty_department ON faculty (department);
+CREATE INDEX IF NOT EXISTS idx_faculty_status ON faculty (status);
+
+-- Serves audit log pages filtered by a timestamp range and action
+CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp_action
+    ON audit_logs (timestamp DESC, action);
+"""
+
+# Server-side prepared statements, prepared once per connection on first use
+PREPARED_STATEMENTS = {
+    # A NULL status matches every request, so one plan serves both cases
+    'req_for_fac': """
+    SELECT r.*, s.name AS student_name
+    FROM consultation_requests r
+    JOIN students s ON r.student_id = s.student_id
+    WHERE r.faculty_id = $1 AND ($2::varchar IS NULL OR r.status = $2)
+    ORDER BY r.created_at DESC
+    """,
+    # NULL filters match every row; $3 is an ILIKE pattern for name or email
+    'search_fac': """
+    SELECT * FROM faculty
+    WHERE ($1::varchar IS NULL OR department = $1)
+      AND ($2::varchar IS NULL OR status = $2)
+      AND ($3::varchar IS NULL OR name ILIKE $3 OR email ILIKE $3)
+    ORDER BY name
+    LIMIT $4 OFFSET $5
+    """,
+}
+
 class PostgreSQLAdapter(DatabaseAdapter):
     """
     PostgreSQL database adapter implementation.
@@ -51,6 +175,12 @@ class PostgreSQLAdapter(DatabaseAdapter):
         self.conn = None
         self.connected = False
         
+        # Names of statements prepared on the current connection
+        self._prepared = set()
+        
+        # Collections changed while data_changed emissions are being batched
+        self._signal_batch = None
+        
         # Initialize connection
         self.connect()
         
@@ -66,6 +196,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
             self.logger.info(f"Connecting to PostgreSQL database at {self.db_params['host']}:{self.db_params['port']}")
             self.conn = psycopg2.connect(**self.db_params)
             self.conn.autocommit = True
+            self._prepared.clear()
             
             # Initialize tables
             self._initialize_tables()
@@ -101,114 +232,18 @@ class PostgreSQLAdapter(DatabaseAdapter):
             
         try:
             with self.conn.cursor() as cur:
-                # Faculty table
-                cur.execute("""
-                CREATE TABLE IF NOT EXISTS faculty (
-                    faculty_id VARCHAR(50) PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    department VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) UNIQUE NOT NULL,
-                    phone VARCHAR(20),
-                    office VARCHAR(50),
-                    ble_beacon_id VARCHAR(50),
-                    status VARCHAR(20) DEFAULT 'unavailable',
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """)
-                
-                # Students table
-                cur.execute("""
-                CREATE TABLE IF NOT EXISTS students (
-                    student_id VARCHAR(50) PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    department VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) UNIQUE NOT NULL,
-                    rfid_id VARCHAR(50) UNIQUE,
-                    last_login TIMESTAMP
-                )
-                """)
-                
-                # Offices table
-                cur.execute("""
-                CREATE TABLE IF NOT EXISTS offices (
-                    office_id VARCHAR(50) PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    building VARCHAR(100) NOT NULL,
-                    floor INTEGER DEFAULT 1,
-                    room VARCHAR(20) NOT NULL,
-                    ble_beacon_id VARCHAR(50),
-                    status VARCHAR(20) DEFAULT 'active',
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """)
-                
-                # Consultation requests table
-                cur.execute("""
-                CREATE TABLE IF NOT EXISTS consultation_requests (
-                    request_id VARCHAR(50) PRIMARY KEY,
-                    student_id VARCHAR(50) NOT NULL REFERENCES students(student_id),
-                    faculty_id VARCHAR(50) NOT NULL REFERENCES faculty(faculty_id),
-                    subject VARCHAR(200) NOT NULL,
-                    message TEXT,
-                    status VARCHAR(20) DEFAULT 'pending',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """)
-                
-                # Consultations table
-                cur.execute("""
-                CREATE TABLE IF NOT EXISTS consultations (
-                    consultation_id VARCHAR(50) PRIMARY KEY,
-                    request_id VARCHAR(50) REFERENCES consultation_requests(request_id),
-                    student_id VARCHAR(50) NOT NULL REFERENCES students(student_id),
-                    faculty_id VARCHAR(50) NOT NULL REFERENCES faculty(faculty_id),
-                    subject VARCHAR(200) NOT NULL,
-                    start_time TIMESTAMP,
-                    end_time TIMESTAMP,
-                    notes TEXT,
-                    status VARCHAR(20) DEFAULT 'scheduled',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """)
-                
-                # Admin users table
-                cur.execute("""
-                CREATE TABLE IF NOT EXISTS admin_users (
-                    admin_id VARCHAR(50) PRIMARY KEY,
-                    username VARCHAR(50) UNIQUE NOT NULL,
-                    password_hash VARCHAR(128) NOT NULL,
-                    name VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) UNIQUE NOT NULL,
-                    role VARCHAR(20) DEFAULT 'admin',
-                    last_login TIMESTAMP
-                )
-                """)
-                
-                # Audit log table
-                cur.execute("""
-                CREATE TABLE IF NOT EXISTS audit_logs (
-                    log_id VARCHAR(50) PRIMARY KEY,
-                    user_id VARCHAR(50),
-                    action VARCHAR(50) NOT NULL,
-                    entity_type VARCHAR(50) NOT NULL,
-                    entity_id VARCHAR(50),
-                    details JSONB,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """)
+                # Create extension and tables in one round-trip
+                cur.execute(SCHEMA_DDL)
                 
                 # Check if default admin exists, create if not
                 cur.execute("SELECT COUNT(*) FROM admin_users WHERE username = 'admin'")
                 if cur.fetchone()[0] == 0:
                     # Create default admin
-                    admin_id = str(uuid.uuid4())
                     password_hash = hashlib.sha256("admin123".encode()).hexdigest()
                     cur.execute("""
-                    INSERT INTO admin_users (admin_id, username, password_hash, name, email, role)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    """, (admin_id, "admin", password_hash, "Administrator", "admin@consultease.edu", "superadmin"))
+                    INSERT INTO admin_users (username, password_hash, name, email, role)
+                    VALUES (%s, %s, %s, %s, %s)
+                    """, ("admin", password_hash, "Administrator", "admin@consultease.edu", "superadmin"))
                     self.logger.info("Created default admin user (username: admin, password: admin123)")
                 
                 self.logger.info("Database tables initialized")
@@ -238,15 +273,14 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 return None
                 
         try:
-            with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
+            # RealDictCursor builds each row as a dict while fetching
+            with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                 cur.execute(query, params or ())
                 
                 if fetch_one:
-                    result = cur.fetchone()
-                    return dict(result) if result else None
+                    return cur.fetchone()
                 elif fetch_all:
-                    results = cur.fetchall()
-                    return [dict(row) for row in results]
+                    return cur.fetchall()
                     
                 return True
                 
@@ -254,17 +288,129 @@ class PostgreSQLAdapter(DatabaseAdapter):
             self.logger.error(f"Error executing query: {e}")
             return None
             
-    def _generate_id(self, prefix=""):
+    def _execute_prepared(self, name, params, fetch_one=False, fetch_all=False):
         """
-        Generate a unique ID for database records.
+        Execute a statement from PREPARED_STATEMENTS, preparing it if needed.
         
         Args:
-            prefix (str, optional): ID prefix
+            name (str): Prepared statement name
+            params (tuple): Statement parameters
+            fetch_one (bool, optional): Whether to fetch one result
+            fetch_all (bool, optional): Whether to fetch all results
             
         Returns:
-            str: Unique ID
+            mixed: Query results if fetch_one or fetch_all is True, else None
+        """
+        if name not in self._prepared:
+            if self._execute_query(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}") is None:
+                return None
+            self._prepared.add(name)
+            
+        placeholders = ', '.join(['%s'] * len(params))
+        return self._execute_query(f"EXECUTE {name} ({placeholders})", params,
+                                   fetch_one=fetch_one, fetch_all=fetch_all)
+    
+    def _emit_data_changed(self, collection, doc_id):
+        """
+        Emit data_changed, or record it if emissions are being batched.
+        
+        Args:
+            collection (str): Changed collection
+            doc_id (str): Changed document ID
+        """
+        if self._signal_batch is not None:
+            self._signal_batch.setdefault(collection, []).append(doc_id)
+        else:
+            self.data_changed.emit(collection, doc_id)
+            
+    @contextmanager
+    def _batched_signals(self):
+        """
+        Coalesce data_changed emissions made inside the block.
+        
+        Each changed collection is emitted once on exit with '*' as the
+        document ID, so listeners refresh once per batch instead of once per row.
+        """
+        if self._signal_batch is not None:
+            # Already batching; the outer block emits
+            yield
+            return
+            
+        self._signal_batch = {}
+        try:
+            yield
+        finally:
+            batch, self._signal_batch = self._signal_batch, None
+            for collection in batch:
+                self.data_changed.emit(collection, '*')
+    
+    def migrate_to_native_uuid(self):
+        """
+        Convert key columns of an existing database from VARCHAR to UUID.
+        
+        Databases created before keys were stored as native uuid values keep
+        their VARCHAR(50) columns, since CREATE TABLE IF NOT EXISTS does not
+        alter them. Legacy IDs carry a prefix (e.g. "faculty_"), which is
+        stripped before the cast. Foreign keys are dropped and re-created
+        around the type change, all inside a single transaction.
+        
+        Returns:
+            bool: True if successful, False otherwise
         """
-        return f"{prefix}{str(uuid.uuid4())}"
+        if not self.conn:
+            self.logger.error("Cannot migrate to native UUID: not connected")
+            return False
+            
+        self.logger.info("Migrating key columns to native UUID type")
+        
+        def to_uuid(table, column):
+            return (
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid "
+                f"USING regexp_replace({column}, '^[a-z]+_', '')::uuid"
+            )
+            
+        statements = [
+            "CREATE EXTENSION IF NOT EXISTS pgcrypto",
+            "ALTER TABLE consultations DROP CONSTRAINT IF EXISTS consultations_request_id_fkey",
+            "ALTER TABLE consultations DROP CONSTRAINT IF EXISTS consultations_faculty_id_fkey",
+            "ALTER TABLE consultation_requests DROP CONSTRAINT IF EXISTS consultation_requests_faculty_id_fkey",
+            to_uuid("faculty", "faculty_id"),
+            to_uuid("consultation_requests", "request_id"),
+            to_uuid("consultation_requests", "faculty_id"),
+            to_uuid("consultations", "consultation_id"),
+            to_uuid("consultations", "request_id"),
+            to_uuid("consultations", "faculty_id"),
+            to_uuid("admin_users", "admin_id"),
+            to_uuid("audit_logs", "log_id"),
+            "ALTER TABLE faculty ALTER COLUMN faculty_id SET DEFAULT gen_random_uuid()",
+            "ALTER TABLE consultation_requests ALTER COLUMN request_id SET DEFAULT gen_random_uuid()",
+            "ALTER TABLE consultations ALTER COLUMN consultation_id SET DEFAULT gen_random_uuid()",
+            "ALTER TABLE admin_users ALTER COLUMN admin_id SET DEFAULT gen_random_uuid()",
+            "ALTER TABLE audit_logs ALTER COLUMN log_id SET DEFAULT gen_random_uuid()",
+            "ALTER TABLE consultation_requests ADD CONSTRAINT consultation_requests_faculty_id_fkey "
+            "FOREIGN KEY (faculty_id) REFERENCES faculty(faculty_id)",
+            "ALTER TABLE consultations ADD CONSTRAINT consultations_request_id_fkey "
+            "FOREIGN KEY (request_id) REFERENCES consultation_requests(request_id)",
+            "ALTER TABLE consultations ADD CONSTRAINT consultations_faculty_id_fkey "
+            "FOREIGN KEY (faculty_id) REFERENCES faculty(faculty_id)",
+        ]
+        
+        try:
+            self.conn.autocommit = False
+            with self.conn.cursor() as cur:
+                for statement in statements:
+                    cur.execute(statement)
+            self.conn.commit()
+            self.logger.info("Key columns migrated to native UUID type")
+            return True
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"Error migrating key columns to UUID: {e}")
+            return False
+            
+        finally:
+            self.conn.autocommit = True
     
     def get_faculty_by_id(self, faculty_id):
         """
@@ -330,6 +476,32 @@ class PostgreSQLAdapter(DatabaseAdapter):
         query = "SELECT * FROM faculty ORDER BY name"
         return self._execute_query(query, fetch_all=True)
     
+    def search_faculty(self, dept=None, status=None, q=None, limit=200, offset=0):
+        """
+        Get one page of faculty members matching the given filters.
+        
+        Args:
+            dept (str, optional): Department to include, all departments if None
+            status (str, optional): Status to include, all statuses if None
+            q (str, optional): Text to find in the name or email, case-insensitive
+            limit (int, optional): Maximum number of faculty to return
+            offset (int, optional): Index of the first faculty member to return
+            
+        Returns:
+            list: List of faculty members
+        """
+        self.logger.info(f"Searching faculty (department: {dept}, status: {status}, search: {q})")
+        
+        # Match the search text literally inside the ILIKE pattern
+        pattern = None
+        if q:
+            escaped = q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            pattern = f"%{escaped}%"
+            
+        return self._execute_prepared(
+            "search_fac", (dept or None, status or None, pattern, limit, offset), fetch_all=True
+        )
+    
     def get_office_list(self):
         """
         Get a list of all offices.
@@ -361,20 +533,17 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 self.logger.error(f"Missing required field: {field}")
                 return None
                 
-        # Generate ID if not provided
-        faculty_id = faculty_data.get('faculty_id') or self._generate_id("faculty_")
-        
-        # Insert into database
+        # Insert into database; the server generates the ID if not provided
         query = """
         INSERT INTO faculty (
             faculty_id, name, department, email, phone, office, 
             ble_beacon_id, status, last_updated
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+        ) VALUES (COALESCE(%s, gen_random_uuid()), %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
         RETURNING faculty_id
         """
         
         params = (
-            faculty_id,
+            faculty_data.get('faculty_id'),
             faculty_data.get('name'),
             faculty_data.get('department'),
             faculty_data.get('email'),
@@ -387,12 +556,29 @@ class PostgreSQLAdapter(DatabaseAdapter):
         result = self._execute_query(query, params, fetch_one=True)
         
         if result:
+            faculty_id = str(result['faculty_id'])
+            
             # Emit data changed signal
-            self.data_changed.emit('faculty', faculty_id)
+            self._emit_data_changed('faculty', faculty_id)
             return faculty_id
             
         return None
     
+    def add_faculty_bulk(self, faculty_list):
+        """
+        Add several faculty members, emitting data_changed once.
+        
+        Args:
+            faculty_list (list): List of faculty data dicts
+            
+        Returns:
+            list: Faculty IDs, with None for entries that failed
+        """
+        self.logger.info(f"Adding {len(faculty_list)} faculty members")
+        
+        with self._batched_signals():
+            return [self.add_faculty(faculty_data) for faculty_data in faculty_list]
+    
     def update_faculty(self, faculty_id, faculty_data):
         """
         Update faculty data.
@@ -425,7 +611,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         
         if result:
             # Emit data changed signal
-            self.data_changed.emit('faculty', faculty_id)
+            self._emit_data_changed('faculty', str(faculty_id))
             return True
             
         return False
@@ -461,7 +647,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         
         if result:
             # Emit data changed signal
-            self.data_changed.emit('faculty', faculty_id)
+            self._emit_data_changed('faculty', str(faculty_id))
             return True
             
         return False
@@ -485,20 +671,17 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 self.logger.error(f"Missing required field: {field}")
                 return None
                 
-        # Generate ID if not provided
-        request_id = request_data.get('request_id') or self._generate_id("req_")
-        
-        # Insert into database
+        # Insert into database; the server generates the ID if not provided
         query = """
         INSERT INTO consultation_requests (
             request_id, student_id, faculty_id, subject, message,
             status, created_at, updated_at
-        ) VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        ) VALUES (COALESCE(%s, gen_random_uuid()), %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
         RETURNING request_id
         """
         
         params = (
-            request_id,
+            request_data.get('request_id'),
             request_data.get('student_id'),
             request_data.get('faculty_id'),
             request_data.get('subject'),
@@ -509,8 +692,10 @@ class PostgreSQLAdapter(DatabaseAdapter):
         result = self._execute_query(query, params, fetch_one=True)
         
         if result:
+            request_id = str(result['request_id'])
+            
             # Emit data changed signal
-            self.data_changed.emit('consultation_requests', request_id)
+            self._emit_data_changed('consultation_requests', request_id)
             return request_id
             
         return None
@@ -547,7 +732,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         
         if result:
             # Emit data changed signal
-            self.data_changed.emit('consultation_requests', request_id)
+            self._emit_data_changed('consultation_requests', str(request_id))
             return True
             
         return False
@@ -565,24 +750,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """
         self.logger.info(f"Getting consultation requests for faculty: {faculty_id}")
         
-        if status:
-            query = """
-            SELECT r.*, s.name as student_name
-            FROM consultation_requests r
-            JOIN students s ON r.student_id = s.student_id
-            WHERE r.faculty_id = %s AND r.status = %s
-            ORDER BY r.created_at DESC
-            """
-            return self._execute_query(query, (faculty_id, status), fetch_all=True)
-        else:
-            query = """
-            SELECT r.*, s.name as student_name
-            FROM consultation_requests r
-            JOIN students s ON r.student_id = s.student_id
-            WHERE r.faculty_id = %s
-            ORDER BY r.created_at DESC
-            """
-            return self._execute_query(query, (faculty_id,), fetch_all=True)
+        return self._execute_prepared("req_for_fac", (faculty_id, status or None), fetch_all=True)
     
     def verify_admin_login(self, username, password):
         """
@@ -24,7 +24,8 @@ class DatabaseAdapter(QObject, ABC):
     
     Signals:
         connection_changed (bool): Emitted when the connection status changes
-        data_changed (str, str): Emitted when data changes (collection, document_id)
+        data_changed (str, str): Emitted when data changes (collection, document_id),
+            with '*' as the document_id after a bulk change
     """
     connection_changed = pyqtSignal(bool)
     data_changed = pyqtSignal(str, str)
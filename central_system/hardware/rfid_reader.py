@@ -8,14 +8,24 @@ It supports both real RFID readers and simulation mode with auto-detection.
 """
 
 import os
+import sys
+import re
+import string
 import time
 import threading
 import random
-import queue
+import selectors
+import struct
+import collections
+import functools
+import glob
 import json
+import array
+import pickle
 from datetime import datetime
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, QTimer
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, QSocketNotifier
 from utils.logger import get_logger
+from utils.config import env_bool
 
 # Try to import USB library, but don't fail if not available
 try:
@@ -28,31 +38,106 @@ except ImportError:
 # Try to import evdev for Linux devices
 try:
     import evdev
-    from evdev import categorize, ecodes
+    from evdev import ecodes
     EVDEV_AVAILABLE = True
 except ImportError:
     EVDEV_AVAILABLE = False
 
-# Database of common RFID readers with their USB IDs
-COMMON_RFID_READERS = [
-    {"vendor": 0x08FF, "product": 0x0009, "name": "ACS ACR122U NFC Reader"},
-    {"vendor": 0x04E6, "product": 0x5591, "name": "SCM Microsystems RFID Reader"},
-    {"vendor": 0x1FC9, "product": 0x0120, "name": "NXP RFID Reader"},
-    {"vendor": 0xFFFF, "product": 0x0035, "name": "Generic HID RFID Reader"},
-    {"vendor": 0x0C27, "product": 0x3BFA, "name": "Sycreader RFID Reader"},
-    {"vendor": 0x0403, "product": 0x6001, "name": "FTDI-based RFID Reader"},
-    {"vendor": 0x045E, "product": 0x00DB, "name": "Microsoft Keyboard (RFID Compatible)"},
-    {"vendor": 0x413D, "product": 0x2107, "name": "Velleman RFID Reader"},
-    {"vendor": 0x1A86, "product": 0x7523, "name": "CH340 RFID Reader"},
-    {"vendor": 0x16C0, "product": 0x05DC, "name": "Van Ooijen Technische Informatica RFID Reader"},
-    {"vendor": 0x25AE, "product": 0x24A0, "name": "Microchip RFID Reader"},
-]
+# Database of common RFID readers with their USB IDs: (vendor, product, name)
+COMMON_RFID_READERS = (
+    (0x08FF, 0x0009, "ACS ACR122U NFC Reader"),
+    (0x04E6, 0x5591, "SCM Microsystems RFID Reader"),
+    (0x1FC9, 0x0120, "NXP RFID Reader"),
+    (0xFFFF, 0x0035, "Generic HID RFID Reader"),
+    (0x0C27, 0x3BFA, "Sycreader RFID Reader"),
+    (0x0403, 0x6001, "FTDI-based RFID Reader"),
+    (0x045E, 0x00DB, "Microsoft Keyboard (RFID Compatible)"),
+    (0x413D, 0x2107, "Velleman RFID Reader"),
+    (0x1A86, 0x7523, "CH340 RFID Reader"),
+    (0x16C0, 0x05DC, "Van Ooijen Technische Informatica RFID Reader"),
+    (0x25AE, 0x24A0, "Microchip RFID Reader"),
+)
+
+# (vendor, product) pairs of the known readers, for constant-time membership checks
+COMMON_RFID_IDS = frozenset((vendor, product) for vendor, product, _ in COMMON_RFID_READERS)
+
+# (vendor, product) -> whether the device exposes a HID keyboard interface
+_HID_KEYBOARD_CACHE = {}
 
 # Keywords that indicate a device might be an RFID reader
 RFID_KEYWORDS = [
     "rfid", "reader", "card", "tag", "nfc", "mifare", "acr", "hid", "proximity", "em4100"
 ]
 
+# All keywords in one pattern so a device name is scanned once
+_RFID_KW_RE = re.compile('|'.join(map(re.escape, RFID_KEYWORDS)))
+
+# USB HID keyboard usage IDs produced by keyboard-emulating RFID readers
+_HID_KEYMAP = {
+    0x04: 'a', 0x05: 'b', 0x06: 'c', 0x07: 'd', 0x08: 'e',
+    0x09: 'f', 0x0A: 'g', 0x0B: 'h', 0x0C: 'i', 0x0D: 'j',
+    0x0E: 'k', 0x0F: 'l', 0x10: 'm', 0x11: 'n', 0x12: 'o',
+    0x13: 'p', 0x14: 'q', 0x15: 'r', 0x16: 's', 0x17: 't',
+    0x18: 'u', 0x19: 'v', 0x1A: 'w', 0x1B: 'x', 0x1C: 'y',
+    0x1D: 'z', 0x1E: '1', 0x1F: '2', 0x20: '3', 0x21: '4',
+    0x22: '5', 0x23: '6', 0x24: '7', 0x25: '8', 0x26: '9',
+    0x27: '0', 0x28: '\n', 0x2C: ' '
+}
+
+def _build_hid_table(shifted):
+    """
+    Build a 256-entry lookup table indexed by HID key code.
+    
+    Args:
+        shifted (bool): Whether the shift modifier is held
+        
+    Returns:
+        tuple: Character per key code, empty string for unmapped codes
+    """
+    table = [''] * 256
+    for key_code, char in _HID_KEYMAP.items():
+        table[key_code] = char.upper() if shifted else char
+    return tuple(table)
+
+_HID_MAP = _build_hid_table(False)
+_HID_MAP_SHIFT = _build_hid_table(True)
+
+# Pulls (modifier, key code) out of a HID report in one call, skipping the reserved byte
+_HID_UNPACK = struct.Struct('<BxB').unpack_from
+
+# Evdev key names mapped to the characters they produce
+_EVDEV_MAP = {
+    **{f'KEY_{c}': c.lower() for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'},
+    **{f'KEY_{d}': d for d in '0123456789'},
+    'KEY_SPACE': ' ', 'KEY_ENTER': '\n', 'KEY_DOT': '.', 'KEY_MINUS': '-'
+}
+
+# The same mapping keyed by numeric event code, so events need no categorize()
+_EVDEV_CODE_MAP = (
+    {ecodes.ecodes[name]: char for name, char in _EVDEV_MAP.items()}
+    if EVDEV_AVAILABLE else {}
+)
+
+# Characters kept in an RFID code; bytes.translate deletes every other byte
+_ALLOWED = frozenset(string.ascii_letters + string.digits + ':-.')
+_DELETE_BYTES = bytes(i for i in range(256) if chr(i) not in _ALLOWED)
+
+@functools.lru_cache(maxsize=128)
+def _clean_rfid_code(raw):
+    """
+    Clean a raw scanned RFID code.
+    
+    The same few badges are scanned over and over, so results are cached
+    and interned.
+    
+    Args:
+        raw (bytes): Raw ASCII code as read from the reader
+        
+    Returns:
+        str: Code with disallowed characters removed
+    """
+    return sys.intern(raw.translate(None, _DELETE_BYTES).decode('ascii'))
+
 class RFIDReaderThread(QThread):
     """
     Thread for reading RFID cards.
@@ -78,25 +163,31 @@ class RFIDReaderThread(QThread):
         self.product_id = product_id
         self.simulate = simulate
         self.auto_detect = auto_detect
-        self.running = False
+        self._stop_event = threading.Event()
         self.device = None
         self.detected_reader = None
         self.evdev_device = None
         self.platform = os.name  # 'posix' for Linux/Mac, 'nt' for Windows
         
-        # Buffer for RFID data
-        self.buffer = ""
-        self.buffer_timeout = QTimer()
-        self.buffer_timeout.setInterval(500)  # 500ms timeout for reading
-        self.buffer_timeout.timeout.connect(self._reset_buffer)
+        # Location of the detected-reader cache
+        self._cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+        self._cache_file = os.path.join(self._cache_dir, 'rfid_cache.pkl')
+        self._legacy_cache_file = os.path.join(self._cache_dir, 'rfid_cache.json')
+        self._usb_strings_file = os.path.join(self._cache_dir, 'usb_strings_cache.pkl')
+        
+        # Preallocated buffer for RFID data; _buf_len is the write index
+        self._buf = bytearray(64)
+        self._buf_len = 0
+        self.buffer_timeout_ns = 500_000_000  # 500ms timeout for reading
+        self._last_key_ns = 0
         
         # Reset detection flag
         self.last_detection_time = 0
-        self.detection_cooldown = 2  # seconds
+        self.detection_cooldown_ns = 2_000_000_000  # 2 seconds
         
     def run(self):
         """Thread main function."""
-        self.running = True
+        self._stop_event.clear()
         
         if self.simulate:
             self.status_changed.emit("Simulation mode")
@@ -155,80 +246,66 @@ class RFIDReaderThread(QThread):
         self.logger.info("Starting USB RFID reader auto-detection...")
         self.status_changed.emit("Scanning for RFID readers...")
         
+        # Enumerate the bus once; every check below works on this snapshot
+        try:
+            all_devs = list(usb.core.find(find_all=True))
+        except Exception as e:
+            self.logger.warning(f"Auto-detection error: {e}")
+            return None
+        by_id = {(dev.idVendor, dev.idProduct): dev for dev in all_devs}
+        
         # First, try to load cached reader info if available
-        cache_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'rfid_cache.json')
         try:
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                    if cached_data.get('vendor') and cached_data.get('product'):
-                        self.logger.info(f"Using cached RFID reader: {cached_data.get('name', 'Unknown')}")
-                        # Check if the cached device is still connected
-                        dev = usb.core.find(idVendor=cached_data['vendor'], idProduct=cached_data['product'])
-                        if dev:
-                            return cached_data
-                        else:
-                            self.logger.info("Cached device not found, scanning for new devices")
+            cached_data = self._load_reader_cache()
+            if cached_data and cached_data.get('vendor') and cached_data.get('product'):
+                self.logger.info(f"Using cached RFID reader: {cached_data.get('name', 'Unknown')}")
+                # Check if the cached device is still connected
+                if (cached_data['vendor'], cached_data['product']) in by_id:
+                    return cached_data
+                else:
+                    self.logger.info("Cached device not found, scanning for new devices")
         except Exception as e:
             self.logger.warning(f"Error loading RFID reader cache: {e}")
         
         # Check for common RFID readers first
-        for reader in COMMON_RFID_READERS:
-            try:
-                dev = usb.core.find(idVendor=reader["vendor"], idProduct=reader["product"])
-                if dev:
-                    self.logger.info(f"Found known RFID reader: {reader['name']}")
+        if not COMMON_RFID_IDS.isdisjoint(by_id):
+            for vendor, product, name in COMMON_RFID_READERS:
+                if (vendor, product) in by_id:
+                    self.logger.info(f"Found known RFID reader: {name}")
+                    reader_info = {"vendor": vendor, "product": product, "name": name}
                     # Save to cache for future use
-                    self._save_reader_cache(reader)
-                    return reader
-            except Exception as e:
-                self.logger.debug(f"Error checking for reader {reader['name']}: {e}")
-        
-        # If no common reader found, scan all USB devices
+                    self._save_reader_cache(reader_info)
+                    return reader_info
+        
+        # If no common reader found, scan all USB devices.
+        # Device names come from a persistent cache where possible, since
+        # reading string descriptors costs a control transfer each.
+        string_cache = self._load_usb_strings()
+        strings_changed = False
         try:
-            devices = usb.core.find(find_all=True)
-            for dev in devices:
+            for dev in all_devs:
                 try:
                     vendor_id = dev.idVendor
                     product_id = dev.idProduct
                     
                     # Get device information
-                    try:
-                        manufacturer = usb.util.get_string(dev, dev.iManufacturer)
-                    except:
-                        manufacturer = "Unknown"
-                    
-                    try:
-                        product = usb.util.get_string(dev, dev.iProduct)
-                    except:
-                        product = "Unknown"
-                    
-                    device_name = f"{manufacturer} {product}"
+                    string_key = f"{vendor_id:04x}:{product_id:04x}:{dev.iManufacturer}:{dev.iProduct}"
+                    device_name = string_cache.get(string_key)
+                    if device_name is None:
+                        device_name = self._read_device_name(dev)
+                        if "Unknown" not in device_name:
+                            string_cache[string_key] = device_name
+                            strings_changed = True
                     
                     # Check if this might be an RFID reader based on the device name
-                    is_rfid_reader = False
-                    device_name_lower = device_name.lower()
-                    
-                    for keyword in RFID_KEYWORDS:
-                        if keyword in device_name_lower:
-                            is_rfid_reader = True
-                            break
+                    # casefold() also normalizes non-ASCII descriptor strings
+                    device_name_folded = device_name.casefold()
+                    is_rfid_reader = bool(_RFID_KW_RE.search(device_name_folded))
                     
                     # Also check for HID devices that might be RFID readers
                     # RFID readers often register as HID keyboard devices
-                    if (dev.bDeviceClass == 0 and  # Device class in interface
-                        dev.bNumConfigurations > 0):
-                        try:
-                            for cfg in dev:
-                                for intf in cfg:
-                                    # Check if it's a HID device
-                                    if intf.bInterfaceClass == 3:  # HID class
-                                        # Look for keyboard/keypad
-                                        if intf.bInterfaceSubClass == 1 and intf.bInterfaceProtocol in [1, 2]:
-                                            is_rfid_reader = True
-                                            break
-                        except:
-                            pass
+                    if not is_rfid_reader and self._is_hid_keyboard(dev):
+                        is_rfid_reader = True
                     
                     if is_rfid_reader:
                         reader_info = {
@@ -248,10 +325,127 @@ class RFIDReaderThread(QThread):
         
         except Exception as e:
             self.logger.warning(f"Auto-detection error: {e}")
+            
+        finally:
+            if strings_changed:
+                self._save_usb_strings(string_cache)
         
         self.logger.warning("No RFID readers detected")
         return None
     
+    def _read_device_name(self, dev):
+        """
+        Read a device's manufacturer and product strings from the device.
+        
+        Args:
+            dev (usb.core.Device): USB device
+            
+        Returns:
+            str: "<manufacturer> <product>", with "Unknown" for unreadable strings
+        """
+        # Backends without string descriptor support (libusb0, openusb)
+        # raise NotImplementedError; the name is only cosmetic
+        try:
+            manufacturer = usb.util.get_string(dev, dev.iManufacturer)
+        except (usb.core.USBError, ValueError, NotImplementedError):
+            manufacturer = None
+            
+        try:
+            product = usb.util.get_string(dev, dev.iProduct)
+        except (usb.core.USBError, ValueError, NotImplementedError):
+            product = None
+            
+        return f"{manufacturer or 'Unknown'} {product or 'Unknown'}"
+        
+    def _load_usb_strings(self):
+        """
+        Load the persistent USB device-name cache.
+        
+        Returns:
+            dict: "vid:pid:iManufacturer:iProduct" -> device name
+        """
+        try:
+            if os.path.exists(self._usb_strings_file):
+                with open(self._usb_strings_file, 'rb') as f:
+                    return pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Error loading USB string cache: {e}")
+        return {}
+        
+    def _save_usb_strings(self, string_cache):
+        """
+        Save the persistent USB device-name cache.
+        
+        Args:
+            string_cache (dict): "vid:pid:iManufacturer:iProduct" -> device name
+        """
+        try:
+            if not os.path.exists(self._cache_dir):
+                os.makedirs(self._cache_dir)
+                
+            with open(self._usb_strings_file, 'wb') as f:
+                pickle.dump(string_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.logger.warning(f"Error saving USB string cache: {e}")
+        
+    def _is_hid_keyboard(self, dev):
+        """
+        Check whether a USB device exposes a HID keyboard/keypad interface.
+        
+        The configuration descriptors the OS cached at enumeration are
+        walked, so the device is not opened and no control transfer is sent.
+        Results are cached per (vendor, product) for the lifetime of the process.
+        
+        Args:
+            dev (usb.core.Device): USB device
+            
+        Returns:
+            bool: True if the device has a HID keyboard interface
+        """
+        # Class 0 defers to the interfaces, 3 is HID, 0xEF is a composite
+        # (miscellaneous/IAD) device; anything else can't qualify
+        if dev.bDeviceClass not in (0x00, 0x03, 0xEF) or dev.bNumConfigurations == 0:
+            return False
+            
+        key = (dev.idVendor, dev.idProduct)
+        if key in _HID_KEYBOARD_CACHE:
+            return _HID_KEYBOARD_CACHE[key]
+            
+        try:
+            is_keyboard = any(
+                intf.bInterfaceClass == 3 and  # HID class
+                intf.bInterfaceSubClass == 1 and intf.bInterfaceProtocol in (1, 2)  # Keyboard/keypad
+                for cfg in dev
+                for intf in cfg
+            )
+        except (usb.core.USBError, NotImplementedError):
+            return False
+            
+        _HID_KEYBOARD_CACHE[key] = is_keyboard
+        return is_keyboard
+        
+    def _load_reader_cache(self):
+        """
+        Load detected reader information from cache file.
+        
+        A cache left in the old JSON format is converted to pickle once.
+        
+        Returns:
+            dict: Cached reader information, or None if there is no cache
+        """
+        if os.path.exists(self._cache_file):
+            with open(self._cache_file, 'rb') as f:
+                return pickle.load(f)
+                
+        if os.path.exists(self._legacy_cache_file):
+            with open(self._legacy_cache_file, 'r') as f:
+                reader_info = json.load(f)
+            self._save_reader_cache(reader_info)
+            os.remove(self._legacy_cache_file)
+            return reader_info
+            
+        return None
+        
     def _save_reader_cache(self, reader_info):
         """
         Save detected reader information to cache file.
@@ -259,17 +453,14 @@ class RFIDReaderThread(QThread):
         Args:
             reader_info (dict): Reader information to save
         """
-        cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        cache_file = os.path.join(cache_dir, 'rfid_cache.json')
-        
         try:
             # Create directory if it doesn't exist
-            if not os.path.exists(cache_dir):
-                os.makedirs(cache_dir)
+            if not os.path.exists(self._cache_dir):
+                os.makedirs(self._cache_dir)
                 
             # Save cache file
-            with open(cache_file, 'w') as f:
-                json.dump(reader_info, f)
+            with open(self._cache_file, 'wb') as f:
+                pickle.dump(reader_info, f, protocol=pickle.HIGHEST_PROTOCOL)
             
             self.logger.info(f"Saved RFID reader info to cache: {reader_info['name']}")
         except Exception as e:
@@ -277,15 +468,36 @@ class RFIDReaderThread(QThread):
         
     def stop(self):
         """Stop the thread."""
-        self.running = False
-        self.buffer_timeout.stop()
+        self._stop_event.set()
         
-    def _reset_buffer(self):
-        """Reset the RFID data buffer after timeout."""
-        if self.buffer:
-            self.logger.debug(f"Buffer timeout, resetting buffer: {self.buffer}")
-            self.buffer = ""
-        self.buffer_timeout.stop()
+    def _buffer_char(self, char):
+        """
+        Add a decoded character to the RFID buffer, processing the code at end of scan.
+        
+        A partial scan older than buffer_timeout_ns is discarded first. This is
+        checked here on the reader thread rather than with a QTimer, which
+        would need an event loop the blocking read loops never run.
+        
+        Args:
+            char (str): Decoded character
+        """
+        now = time.monotonic_ns()
+        if self._buf_len and now - self._last_key_ns > self.buffer_timeout_ns:
+            self.logger.debug(f"Buffer timeout, resetting buffer: {self._buf[:self._buf_len]}")
+            self._buf_len = 0
+        self._last_key_ns = now
+        
+        # Add character to buffer, dropping a runaway scan
+        if self._buf_len >= len(self._buf):
+            self._buf_len = 0
+        self._buf[self._buf_len] = ord(char)
+        self._buf_len += 1
+        
+        # If end of scan detected (often CR/LF or the Enter key)
+        if char == '\n' or char == '\r':
+            # Pass the code without the terminator; cleaning drops any other whitespace
+            self._process_rfid_code(bytes(self._buf[:self._buf_len - 1]))
+            self._buf_len = 0
         
     def _connect_usb_reader(self):
         """Connect to the RFID reader device via USB."""
@@ -298,22 +510,13 @@ class RFIDReaderThread(QThread):
         if self.vendor_id and self.product_id:
             self.device = usb.core.find(idVendor=self.vendor_id, idProduct=self.product_id)
         else:
-            # Try to find a common RFID reader if not specified
-            common_readers = [
-                {"vendor": 0x08FF, "product": 0x0009},  # ACS ACR122U
-                {"vendor": 0x04E6, "product": 0x5591},  # SCM Microsystems
-                {"vendor": 0x1FC9, "product": 0x0120},  # NXP
-                {"vendor": 0xFFFF, "product": 0x0035},  # Generic HID RFID Reader
-                {"vendor": 0x0C27, "product": 0x3BFA},  # Sycreader RFID
-                {"vendor": 0x0403, "product": 0x6001}   # FTDI-based readers
-            ]
-            
-            for reader in common_readers:
-                self.device = usb.core.find(idVendor=reader["vendor"], idProduct=reader["product"])
-                if self.device:
-                    self.vendor_id = reader["vendor"]
-                    self.product_id = reader["product"]
-                    break
+            # Try to find a common RFID reader if not specified, in one bus walk
+            self.device = usb.core.find(
+                custom_match=lambda dev: (dev.idVendor, dev.idProduct) in COMMON_RFID_IDS
+            )
+            if self.device:
+                self.vendor_id = self.device.idVendor
+                self.product_id = self.device.idProduct
         
         if not self.device:
             self.logger.warning("No USB RFID reader found")
@@ -344,6 +547,10 @@ class RFIDReaderThread(QThread):
                     
             if not self.endpoint:
                 raise Exception("Could not find input endpoint")
+                
+            # One transfer per packet; readers with 64-byte endpoints can
+            # pack several 8-byte HID reports into it
+            self._read_size = self.endpoint.wMaxPacketSize
             
         except Exception as e:
             self.logger.error(f"Error configuring USB RFID reader: {e}")
@@ -357,16 +564,29 @@ class RFIDReaderThread(QThread):
             self.status_changed.emit("Evdev library not available")
             raise ImportError("Evdev library not available")
             
-        # Find devices that might be RFID readers (keyboards)
-        devices = [evdev.InputDevice(path) for path in evdev.list_devices()]
+        # Find devices that might be RFID readers (keyboards). Names are read from
+        # sysfs so only the matching device is opened.
+        name_paths = glob.glob('/sys/class/input/event*/device/name')
+        name_paths.sort(key=lambda path: int(path.split('/')[4][len('event'):]))
         
         # Look for device with "RFID" or "Reader" in the name
-        for device in devices:
-            name = device.name.lower()
+        for name_path in name_paths:
+            try:
+                with open(name_path) as f:
+                    device_name = f.read().strip()
+            except OSError:
+                continue
+                
+            name = device_name.lower()
             if ("rfid" in name or "reader" in name or "card" in name or 
                 "hid" in name or "keyboard" in name):
-                self.evdev_device = device
-                self.logger.info(f"Found potential RFID reader: {device.name}")
+                # Nodes this process can't open (e.g. root-only) are skipped
+                try:
+                    self.evdev_device = evdev.InputDevice(f"/dev/input/{name_path.split('/')[4]}")
+                except OSError as e:
+                    self.logger.debug(f"Skipping {device_name}: {e}")
+                    continue
+                self.logger.info(f"Found potential RFID reader: {device_name}")
                 break
                 
         if not self.evdev_device:
@@ -384,196 +604,169 @@ class RFIDReaderThread(QThread):
         self.logger.info("Starting USB RFID reader loop")
         self.status_changed.emit("Ready to scan (USB)")
         
-        # Setup for reading
-        timeout = 100  # ms
-        buffer = ""
+        # Setup for reading; the blocking read parks the thread between packets,
+        # so the timeout only bounds how long a stop() takes to be noticed
+        timeout = 250  # ms
+        
+        # Bind the hot-loop lookups once
+        read = self.endpoint.read
+        decode = self._decode_hid_keycode
+        stopped = self._stop_event.is_set
+        
+        # Transfers land in one reusable buffer instead of a new array per read
+        data = array.array('B', bytes(self._read_size))
         
-        while self.running:
+        while not stopped():
             try:
                 # Read data from the endpoint
                 try:
-                    data = self.endpoint.read(self.endpoint.wMaxPacketSize, timeout)
-                    if data:
-                        # Most RFID readers act as HID keyboards
-                        # The data format depends on the reader, but often follows USB HID keyboard format
-                        char = self._decode_hid_keycode(data)
+                    length = read(data, timeout)
+                    # Most RFID readers act as HID keyboards
+                    # The data format depends on the reader, but often follows USB HID keyboard format,
+                    # with one 8-byte report per key event; only reports fully inside
+                    # this transfer are decoded, the rest of the buffer is stale
+                    for offset in range(0, length - 2, 8):
+                        char = decode(data, offset)
                         if char:
-                            # Start timeout to detect end of scan
-                            if not self.buffer_timeout.isActive():
-                                self.buffer_timeout.start()
-                                
-                            # Add character to buffer
-                            self.buffer += char
-                            
-                            # If end of scan detected (often CR or LF)
-                            if char == '\n' or char == '\r':
-                                self._process_rfid_code(self.buffer.strip())
-                                self.buffer = ""
-                                self.buffer_timeout.stop()
+                            self._buffer_char(char)
                 except usb.core.USBError as e:
                     if e.errno != 110:  # Timeout error is normal
                         raise
                 
-                time.sleep(0.01)  # Small sleep to prevent CPU hogging
-                
             except Exception as e:
-                if self.running:  # Only log if we're still supposed to be running
+                if not self._stop_event.is_set():  # Only log if we're still supposed to be running
                     self.logger.error(f"Error reading from USB RFID reader: {e}")
                     self.error_occurred.emit(f"Reading error: {e}")
-                    time.sleep(1)  # Wait before retrying
+                    self._stop_event.wait(1)  # Wait before retrying
                     
     def _run_evdev_reader(self):
         """
         Run the evdev RFID reader in a loop (Linux only).
         """
         self.logger.info("Starting evdev RFID reader loop")
-        
-        try:
-            # Grab the device for exclusive access
-            self.evdev_device.grab()
-            self.logger.info(f"Grabbed evdev device {self.evdev_device.path} for exclusive access.")
-            self.status_changed.emit("Ready to scan (evdev)")
-        except Exception as e:
-            self.logger.warning(f"Could not grab evdev device {self.evdev_device.path}: {e}. Input may be duplicated.")
-            self.status_changed.emit("Ready to scan (evdev - shared)")
+        self._grab_evdev_device()
 
-        while self.running:
+        # Register the device once; epoll on Linux wakes only when events are pending
+        selector = selectors.DefaultSelector()
+        selector.register(self.evdev_device.fd, selectors.EVENT_READ)
+        
+        # Bind the hot-loop lookups once
+        read = self.evdev_device.read
+        handle_events = self._handle_evdev_events
+        
+        while not self._stop_event.is_set():
             try:
-                # Read events from the device
-                for event in self.evdev_device.read_loop():
-                    if not self.running:
-                        break
-                        
-                    if event.type == ecodes.EV_KEY:
-                        key_event = categorize(event)
-                        
-                        # Only process key down events
-                        if key_event.keystate == key_event.key_down:
-                            key_char = self._decode_evdev_keycode(key_event.keycode)
-                            
-                            if key_char:
-                                # Start timeout to detect end of scan
-                                if not self.buffer_timeout.isActive():
-                                    self.buffer_timeout.start()
-                                    
-                                # Add character to buffer
-                                self.buffer += key_char
-                                
-                                # If end of scan detected (often Enter key)
-                                if key_char == '\n' or key_char == '\r':
-                                    self._process_rfid_code(self.buffer.strip())
-                                    self.buffer = ""
-                                    self.buffer_timeout.stop()
+                # Wait for input, waking periodically to check for stop()
+                if not selector.select(timeout=0.25):
+                    continue
+                    
+                # Drain every pending event in one batch
+                try:
+                    events = list(read())
+                except BlockingIOError:
+                    continue
+                    
+                handle_events(events)
                                     
             except (IOError, OSError) as e:
-                if self.running:  # Only log if we're still supposed to be running
+                if not self._stop_event.is_set():  # Only log if we're still supposed to be running
                     self.logger.error(f"Error reading from evdev RFID reader: {e}")
                     self.error_occurred.emit(f"Reading error: {e}")
-                    time.sleep(1)  # Wait before retrying
+                    self._stop_event.wait(1)  # Wait before retrying
                     
             except Exception as e:
-                if self.running:
+                if not self._stop_event.is_set():
                     self.logger.error(f"Unexpected error in evdev reader: {e}")
                     self.error_occurred.emit(f"Reader error: {e}")
-                    time.sleep(1)
+                    self._stop_event.wait(1)
                     
         # Release device when done
+        selector.close()
         try:
             self.evdev_device.ungrab()
         except:
             pass
             
-    def _decode_hid_keycode(self, data):
+    def _grab_evdev_device(self):
+        """Grab the connected evdev device for exclusive access, if possible."""
+        try:
+            self.evdev_device.grab()
+            self.logger.info(f"Grabbed evdev device {self.evdev_device.path} for exclusive access.")
+            self.status_changed.emit("Ready to scan (evdev)")
+        except Exception as e:
+            self.logger.warning(f"Could not grab evdev device {self.evdev_device.path}: {e}. Input may be duplicated.")
+            self.status_changed.emit("Ready to scan (evdev - shared)")
+            
+    def _handle_evdev_events(self, events):
+        """
+        Feed a batch of evdev events into the RFID buffer.
+        
+        Args:
+            events (list): evdev InputEvent objects
+        """
+        decode = self._decode_evdev_keycode
+        EV_KEY = ecodes.EV_KEY
+        
+        for event in events:
+            # Only process key down events (value 1); EV_SYN, EV_MSC and
+            # key-up events are dropped by the first comparison that fails
+            if event.type == EV_KEY and event.value == 1:
+                key_char = decode(event.code)
+                
+                if key_char:
+                    self._buffer_char(key_char)
+            
+    def _decode_hid_keycode(self, data, offset=0):
         """
         Decode HID keyboard data to character.
         This is a simplified implementation - actual decoding depends on the reader's format.
         
         Args:
             data (array): USB HID data
+            offset (int, optional): Start of the report within data
             
         Returns:
             str: Decoded character or empty string
         """
-        # Simple implementation for common RFID readers that act as keyboards
-        # Actual implementation depends on the specific reader's format
-        
-        # Skip empty or malformed data
-        if len(data) < 2:
+        # Common format: byte 0 is modifier, byte 2 is key code
+        if len(data) - offset < 3:
             return ""
             
-        # Common format: byte 0 is modifier, byte 2 is key code
-        key_code = data[2] if len(data) > 2 else 0
-        
-        # Simple mapping for common ASCII characters
-        # This is a basic implementation and may need to be customized
-        key_map = {
-            0x04: 'a', 0x05: 'b', 0x06: 'c', 0x07: 'd', 0x08: 'e',
-            0x09: 'f', 0x0A: 'g', 0x0B: 'h', 0x0C: 'i', 0x0D: 'j',
-            0x0E: 'k', 0x0F: 'l', 0x10: 'm', 0x11: 'n', 0x12: 'o',
-            0x13: 'p', 0x14: 'q', 0x15: 'r', 0x16: 's', 0x17: 't',
-            0x18: 'u', 0x19: 'v', 0x1A: 'w', 0x1B: 'x', 0x1C: 'y',
-            0x1D: 'z', 0x1E: '1', 0x1F: '2', 0x20: '3', 0x21: '4',
-            0x22: '5', 0x23: '6', 0x24: '7', 0x25: '8', 0x26: '9',
-            0x27: '0', 0x28: '\n', 0x2C: ' '
-        }
-        
-        # Check if key code is in our map
-        if key_code in key_map:
-            # Handle shift key (modifier bit 1)
-            if data[0] & 0x02 and key_code >= 0x04 and key_code <= 0x1D:
-                return key_map[key_code].upper()
-            return key_map[key_code]
-            
-        return ""
+        modifier, key_code = _HID_UNPACK(data, offset)
+        
+        # Shift (modifier bit 1) selects the upper-case table
+        table = _HID_MAP_SHIFT if modifier & 0x02 else _HID_MAP
+        return table[key_code]
         
     def _decode_evdev_keycode(self, keycode):
         """
         Decode evdev keycode to character.
+        Thin wrapper around the module-level _EVDEV_CODE_MAP lookup.
         
         Args:
-            keycode (str): Evdev keycode (e.g., 'KEY_A')
+            keycode (int): Evdev key code (e.g., ecodes.KEY_A)
             
         Returns:
             str: Decoded character or empty string
         """
-        # Remove 'KEY_' prefix
-        if keycode.startswith('KEY_'):
-            key = keycode[4:]
-        else:
-            return ""
-            
-        # Map common keys
-        if len(key) == 1 and key.isalnum():
-            return key.lower()
-        elif key == 'SPACE':
-            return ' '
-        elif key == 'ENTER':
-            return '\n'
-        elif key in ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']:
-            return key
-        elif key == 'DOT':
-            return '.'
-        elif key == 'MINUS':
-            return '-'
-            
-        return ""
+        return _EVDEV_CODE_MAP.get(keycode, "")
             
     def _process_rfid_code(self, rfid_code):
         """
         Process a complete RFID code.
         
         Args:
-            rfid_code (str): RFID code
+            rfid_code (bytes): Raw RFID code
         """
         # Clean up code (remove any non-alphanumeric chars except common separators)
-        cleaned_code = ''.join(c for c in rfid_code if c.isalnum() or c in ':-.')
+        cleaned_code = _clean_rfid_code(rfid_code)
         
         if not cleaned_code:
             return
             
         # Check for detection cooldown to prevent duplicate reads
-        current_time = time.time()
-        if current_time - self.last_detection_time < self.detection_cooldown:
+        current_time = time.monotonic_ns()
+        if current_time - self.last_detection_time < self.detection_cooldown_ns:
             self.logger.debug(f"Ignoring duplicate RFID read: {cleaned_code}")
             return
             
@@ -590,28 +783,26 @@ class RFIDReaderThread(QThread):
         sample_ids = ["A1B2C3D4", "E5F6G7H8", "I9J0K1L2"]
         
         # Check if we should use deterministic mode for testing
-        test_mode = os.getenv("RFID_TEST_MODE", "False").lower() == "true"
+        test_mode = env_bool("RFID_TEST_MODE")
         test_id = os.getenv("RFID_TEST_ID", "")
         
-        while self.running:
+        while not self._stop_event.is_set():
             # In test mode, emit the test ID if provided
             if test_mode and test_id:
                 self.card_detected.emit(test_id)
-                time.sleep(5)  # Wait before emitting again
+                self._stop_event.wait(5)  # Wait before emitting again
                 continue
                 
-            # Randomly simulate an RFID scan every 10-30 seconds
+            # Randomly simulate an RFID scan every 10-30 seconds;
+            # stop() interrupts the wait immediately
             wait_time = random.randint(10, 30)
-            for _ in range(wait_time):
-                if not self.running:
-                    break
-                time.sleep(1)
+            if self._stop_event.wait(timeout=wait_time):
+                break
                 
-            if self.running:
-                # If not in test mode, pick a random ID
-                rfid_id = random.choice(sample_ids)
-                self.logger.info(f"Simulated RFID scan: {rfid_id}")
-                self.card_detected.emit(rfid_id)
+            # If not in test mode, pick a random ID
+            rfid_id = random.choice(sample_ids)
+            self.logger.info(f"Simulated RFID scan: {rfid_id}")
+            self.card_detected.emit(rfid_id)
 
 class HybridRFIDReader(QObject):
     """
@@ -639,10 +830,10 @@ class HybridRFIDReader(QObject):
         self.logger = get_logger(__name__)
         
         # Check if simulation mode is enabled
-        self.simulation_mode = os.getenv("RFID_SIMULATION_MODE", "False").lower() == "true"
+        self.simulation_mode = env_bool("RFID_SIMULATION_MODE")
         
         # Check if auto-detection is enabled (default to True)
-        self.auto_detect = os.getenv("RFID_AUTO_DETECT", "True").lower() == "true"
+        self.auto_detect = env_bool("RFID_AUTO_DETECT", True)
         
         # Get vendor and product IDs from environment if available
         vendor_id_str = os.getenv("RFID_VENDOR_ID", "")
@@ -654,24 +845,37 @@ class HybridRFIDReader(QObject):
         # Create reader thread
         self.reader_thread = None
         
-        # Queue for detected RFID card IDs
-        self.rfid_queue = queue.Queue()
+        # Without pyusb, evdev readers are watched from the event loop instead
+        self._evdev_reader = None
+        self._evdev_notifier = None
         
-        # Recent detections to prevent duplicates
-        self.recent_detections = {}
-        self.detection_timeout = 5  # seconds
+        # Bounded queue of detected RFID card IDs; deque append/popleft are atomic,
+        # so the single producer and consumer need no lock. Scans pushed out
+        # of a full queue are counted and logged
+        self.rfid_queue = collections.deque(maxlen=64)
+        self.rfid_queue_dropped = 0
+        
+        # Recent (rfid_id, timestamp) detections to prevent duplicates, oldest first;
+        # maxlen bounds it, so it never needs cleaning up
+        self.recent_detections = collections.deque(maxlen=16)
+        self.detection_timeout_ns = 5_000_000_000  # 5 seconds
         
         # Store detected reader info
         self.detected_reader = None
 
     def start_detection(self):
         """Start RFID detection."""
-        if self.reader_thread and self.reader_thread.isRunning():
+        if (self.reader_thread and self.reader_thread.isRunning()) or self._evdev_notifier:
             self.logger.warning("RFID reader thread already running")
             return
             
         self.logger.info("Starting RFID detection")
         
+        # evdev is the only hardware path when pyusb is missing; it needs no thread
+        if (not self.simulation_mode and not USB_AVAILABLE and EVDEV_AVAILABLE
+                and os.name == 'posix' and self._start_evdev_notifier()):
+            return
+        
         # Create and configure reader thread
         self.reader_thread = RFIDReaderThread(
             vendor_id=self.vendor_id,
@@ -709,28 +913,90 @@ class HybridRFIDReader(QObject):
             rfid_id (str): Detected RFID card ID
         """
         # Check if this is a duplicate detection
-        current_time = time.time()
-        if rfid_id in self.recent_detections:
-            last_detection = self.recent_detections[rfid_id]
-            if current_time - last_detection < self.detection_timeout:
+        current_time = time.monotonic_ns()
+        detection_timeout = self.detection_timeout_ns
+        # Scan newest first and stop at the first expired entry
+        for detected_id, timestamp in reversed(self.recent_detections):
+            if current_time - timestamp >= detection_timeout:
+                break
+            if detected_id == rfid_id:
                 self.logger.debug(f"Ignoring duplicate RFID read: {rfid_id}")
                 return
                 
-        # Update detection time
-        self.recent_detections[rfid_id] = current_time
-        
-        # Clean up old detections
-        self.recent_detections = {
-            id: timestamp for id, timestamp in self.recent_detections.items()
-            if current_time - timestamp < self.detection_timeout
-        }
+        # Record detection time
+        self.recent_detections.append((rfid_id, current_time))
         
         # Add to queue and emit signal
-        self.rfid_queue.put(rfid_id)
+        if len(self.rfid_queue) == self.rfid_queue.maxlen:
+            self.rfid_queue_dropped += 1
+            self.logger.warning(
+                f"RFID queue full, dropping oldest scan {self.rfid_queue[0]} "
+                f"({self.rfid_queue_dropped} dropped so far)"
+            )
+        self.rfid_queue.append(rfid_id)
         self.card_detected.emit(rfid_id)
 
+    def _start_evdev_notifier(self):
+        """
+        Watch an evdev reader with a QSocketNotifier on the event loop.
+        
+        An unstarted RFIDReaderThread is used for its connection, decoding
+        and duplicate-filtering logic; the notifier wakes only when the
+        kernel has events for the device.
+        
+        Returns:
+            bool: True if an evdev reader was found and is being watched
+        """
+        reader = RFIDReaderThread(simulate=False, auto_detect=False)
+        reader.card_detected.connect(self._handle_card_detection)
+        reader.status_changed.connect(self.status_changed)
+        reader.error_occurred.connect(self.error_occurred)
+        
+        try:
+            reader._connect_evdev_reader()
+        except Exception as e:
+            self.logger.warning(f"Evdev reader connection failed: {e}")
+            return False
+            
+        reader._grab_evdev_device()
+        self._evdev_reader = reader
+        self._evdev_notifier = QSocketNotifier(reader.evdev_device.fd, QSocketNotifier.Type.Read, self)
+        self._evdev_notifier.activated.connect(self._read_evdev_events)
+        return True
+        
+    def _read_evdev_events(self):
+        """Read the pending evdev events when the notifier fires."""
+        try:
+            events = list(self._evdev_reader.evdev_device.read())
+        except BlockingIOError:
+            return
+        except (IOError, OSError) as e:
+            self.logger.error(f"Error reading from evdev RFID reader: {e}")
+            self.error_occurred.emit(f"Reading error: {e}")
+            self._stop_evdev_notifier()
+            return
+            
+        self._evdev_reader._handle_evdev_events(events)
+        
+    def _stop_evdev_notifier(self):
+        """Stop watching the evdev reader and release the device."""
+        self._evdev_notifier.setEnabled(False)
+        self._evdev_notifier.deleteLater()
+        self._evdev_notifier = None
+        
+        try:
+            self._evdev_reader.evdev_device.ungrab()
+        except Exception:
+            pass
+        self._evdev_reader = None
+
     def stop_detection(self):
         """Stop RFID detection."""
+        if self._evdev_notifier:
+            self.logger.info("Stopping RFID detection")
+            self._stop_evdev_notifier()
+            return
+            
         if not self.reader_thread or not self.reader_thread.isRunning():
             return
             
@@ -23,6 +23,7 @@ from PyQt6.QtCore import Qt, QTimer
 
 # Import application modules
 from utils.logger import setup_logger
+from utils.config import env_bool
 from utils.keyboard_handler import KeyboardHandler
 from data.database import DatabaseManager
 from data.mqtt_client import MQTTClient
@@ -58,7 +59,7 @@ def main():
         
         # Setup logging
         log_level = os.getenv("LOG_LEVEL", "INFO")
-        debug_mode = os.getenv("DEBUG_MODE", "False").lower() == "true"
+        debug_mode = env_bool("DEBUG_MODE")
         logger = setup_logger(level=getattr(logging, log_level))
         logger.info("Starting ConsultEase application")
     
@@ -67,34 +68,34 @@ def main():
         app.setApplicationName("ConsultEase")
         app.setApplicationVersion("1.0.0")
     
+        # Show splash screen first so it is not held back by the stylesheet
+        splash_path = Path(__file__).parent / "ui" / "assets" / "splash.png"
+        if splash_path.exists():
+            splash_pixmap = QPixmap(str(splash_path))
+            splash = QSplashScreen(splash_pixmap)
+            splash.show()
+            app.processEvents()
+        else:
+            splash = None
+        
         # Set application style
         app.setStyle("Fusion")  # Base style
         stylesheet = load_stylesheet("dark.qss")  # Custom stylesheet
         app.setStyleSheet(stylesheet)
         
         # Custom font for touchscreen
-        if os.getenv("TOUCHSCREEN_ENABLED", "False").lower() == "true":
+        if env_bool("TOUCHSCREEN_ENABLED"):
             default_font = QFont("Roboto", 12)
             app.setFont(default_font)
         
         # Initialize on-screen keyboard support
-        keyboard_enabled = os.getenv("KEYBOARD_ENABLED", "False").lower() == "true"
+        keyboard_enabled = env_bool("KEYBOARD_ENABLED")
         keyboard_handler = None
         if keyboard_enabled:
             logger.info("Initializing on-screen keyboard support")
             keyboard_handler = KeyboardHandler()
             keyboard_handler.install_event_filter(app)
         
-        # Show splash screen
-        splash_path = Path(__file__).parent / "ui" / "assets" / "splash.png"
-        if splash_path.exists():
-            splash_pixmap = QPixmap(str(splash_path))
-            splash = QSplashScreen(splash_pixmap)
-            splash.show()
-            app.processEvents()
-        else:
-            splash = None
-        
         # Setup exception handler
         setup_exception_handler(debug_mode)
         
@@ -8,15 +8,19 @@ It allows administrators to manage faculty and student information,
 view consultation requests, and system settings.
 """
 
+import time
+import functools
+
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QTabWidget, QLabel, QPushButton, QFrame, QStackedWidget,
-                            QSplitter, QTreeWidget, QTreeWidgetItem, QMessageBox,
-                            QMenu, QToolBar, QStatusBar, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize
+                            QTreeWidget, QTreeWidgetItem, QMessageBox,
+                            QMenu, QToolBar, QStatusBar, QSizePolicy, QButtonGroup)
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QTimer
 from PyQt6.QtGui import QIcon, QAction, QFont
 
 from utils.logger import get_logger
 from utils.error_handler import show_error_dialog, show_confirmation_dialog
+from utils.audit_batcher import AuditLogBatcher
 from data.models import Faculty, Student, ConsultationRequest
 from ui.admin_panels.faculty_manager import FacultyManagerPanel
 from ui.admin_panels.student_manager import StudentManagerPanel
@@ -24,6 +28,22 @@ from ui.admin_panels.request_manager import RequestManagerPanel
 from ui.admin_panels.audit_log_viewer import AuditLogViewerPanel
 from ui.admin_panels.system_settings import SystemSettingsPanel
 
+# Panels are not reloaded on a switch if refreshed this recently and unchanged since
+PANEL_REFRESH_TTL = 30  # seconds
+
+# Panel index showing each database collection
+PANEL_COLLECTIONS = {
+    'faculty': 0,
+    'students': 1,
+    'consultation_requests': 2,
+    'audit_log': 3,
+}
+
+@functools.lru_cache(maxsize=None)
+def _header_font():
+    """Sidebar header font, shared by every admin session; built on first use, once the application exists."""
+    return QFont("Roboto", 16, QFont.Weight.Bold)
+
 class AdminInterface(QMainWindow):
     """
     Admin interface main window for ConsultEase.
@@ -49,6 +69,17 @@ class AdminInterface(QMainWindow):
         self.mqtt_client = mqtt_client
         self.admin_user = admin_user
         
+        # Audit entries are written in batches; flushed again on close
+        self.audit_batcher = AuditLogBatcher(db_manager, parent=self)
+        self.audit_batcher.flushed.connect(self._mark_audit_log_dirty)
+        
+        # Refreshes after panel switches are coalesced, so clicking through
+        # several panels quickly only reloads the one left showing
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(200)
+        self._refresh_timer.timeout.connect(self.refresh_current_panel)
+        
         self.init_ui()
         self.logger.info(f"Admin interface initialized for {admin_user.get('username')}")
         
@@ -72,29 +103,31 @@ class AdminInterface(QMainWindow):
         # Create content area
         self.content_stack = QStackedWidget()
         
-        # Create panels
-        self.faculty_panel = FacultyManagerPanel(self.db_manager, self.mqtt_client)
-        self.student_panel = StudentManagerPanel(self.db_manager)
-        self.request_panel = RequestManagerPanel(self.db_manager, self.mqtt_client)
-        self.audit_panel = AuditLogViewerPanel(self.db_manager)
-        self.settings_panel = SystemSettingsPanel()
-        
-        # Add panels to stack
-        self.content_stack.addWidget(self.faculty_panel)
-        self.content_stack.addWidget(self.student_panel)
-        self.content_stack.addWidget(self.request_panel)
-        self.content_stack.addWidget(self.audit_panel)
-        self.content_stack.addWidget(self.settings_panel)
-        
-        # Create splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.addWidget(self.sidebar)
-        splitter.addWidget(self.content_stack)
-        splitter.setStretchFactor(0, 0)
-        splitter.setStretchFactor(1, 1)
-        splitter.setSizes([200, 800])
-        
-        main_layout.addWidget(splitter)
+        # Panels load their data when built, so each one is built the first
+        # time it is shown; until then the stack holds an empty placeholder
+        self._panel_factories = [
+            lambda: FacultyManagerPanel(self.db_manager, self.mqtt_client, self.audit_batcher),
+            lambda: StudentManagerPanel(self.db_manager),
+            lambda: RequestManagerPanel(self.db_manager, self.mqtt_client),
+            lambda: AuditLogViewerPanel(self.db_manager),
+            lambda: SystemSettingsPanel(),
+        ]
+        self._panels = [None] * len(self._panel_factories)
+        
+        # Per-panel freshness: a panel is reloaded on a switch only if its
+        # data changed or its last refresh is older than PANEL_REFRESH_TTL
+        self._dirty = [False] * len(self._panel_factories)
+        self._last_refresh = [0.0] * len(self._panel_factories)
+        self.db_manager.data_changed.connect(self._mark_collection_dirty)
+        for _ in self._panel_factories:
+            self.content_stack.addWidget(QWidget())
+            
+        # The faculty panel is shown first
+        self.get_panel(0)
+        
+        # The sidebar has a fixed width, so no splitter is needed
+        main_layout.addWidget(self.sidebar)
+        main_layout.addWidget(self.content_stack, 1)
         
         # Create toolbar
         self.create_toolbar()
@@ -113,8 +146,7 @@ class AdminInterface(QMainWindow):
         """
         sidebar = QWidget()
         sidebar.setObjectName("admin-sidebar")
-        sidebar.setMinimumWidth(200)
-        sidebar.setMaximumWidth(250)
+        sidebar.setFixedWidth(220)
         
         sidebar_layout = QVBoxLayout(sidebar)
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
@@ -125,7 +157,7 @@ class AdminInterface(QMainWindow):
         header.setObjectName("admin-header")
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header.setMinimumHeight(50)
-        header.setFont(QFont("Roboto", 16, QFont.Weight.Bold))
+        header.setFont(_header_font())
         sidebar_layout.addWidget(header)
         
         # Navigation buttons
@@ -134,44 +166,47 @@ class AdminInterface(QMainWindow):
         nav_layout.setContentsMargins(10, 10, 10, 10)
         nav_layout.setSpacing(5)
         
+        # The group keeps exactly one button checked and reports clicks by panel index
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        
         # Faculty button
         faculty_btn = QPushButton("Faculty Management")
         faculty_btn.setObjectName("nav-button")
         faculty_btn.setCheckable(True)
         faculty_btn.setChecked(True)
-        faculty_btn.clicked.connect(lambda: self.switch_panel(0, faculty_btn))
+        self.nav_group.addButton(faculty_btn, 0)
         nav_layout.addWidget(faculty_btn)
         
         # Student button
         student_btn = QPushButton("Student Management")
         student_btn.setObjectName("nav-button")
         student_btn.setCheckable(True)
-        student_btn.clicked.connect(lambda: self.switch_panel(1, student_btn))
+        self.nav_group.addButton(student_btn, 1)
         nav_layout.addWidget(student_btn)
         
         # Requests button
         requests_btn = QPushButton("Consultation Requests")
         requests_btn.setObjectName("nav-button")
         requests_btn.setCheckable(True)
-        requests_btn.clicked.connect(lambda: self.switch_panel(2, requests_btn))
+        self.nav_group.addButton(requests_btn, 2)
         nav_layout.addWidget(requests_btn)
         
         # Audit logs button
         audit_btn = QPushButton("Audit Logs")
         audit_btn.setObjectName("nav-button")
         audit_btn.setCheckable(True)
-        audit_btn.clicked.connect(lambda: self.switch_panel(3, audit_btn))
+        self.nav_group.addButton(audit_btn, 3)
         nav_layout.addWidget(audit_btn)
         
         # Settings button
         settings_btn = QPushButton("System Settings")
         settings_btn.setObjectName("nav-button")
         settings_btn.setCheckable(True)
-        settings_btn.clicked.connect(lambda: self.switch_panel(4, settings_btn))
+        self.nav_group.addButton(settings_btn, 4)
         nav_layout.addWidget(settings_btn)
         
-        # Store navigation buttons for state management
-        self.nav_buttons = [faculty_btn, student_btn, requests_btn, audit_btn, settings_btn]
+        self.nav_group.idClicked.connect(self.switch_panel)
         
         sidebar_layout.addWidget(nav_frame)
         
@@ -208,32 +243,80 @@ class AdminInterface(QMainWindow):
         admin_label.setStyleSheet("padding: 0 10px;")
         toolbar.addWidget(admin_label)
         
-    def switch_panel(self, index, button=None):
+    def get_panel(self, index):
         """
-        Switch to the specified panel.
+        Get the panel at the given index, building it on first use.
         
         Args:
             index (int): Panel index
-            button (QPushButton, optional): Button that was clicked
+            
+        Returns:
+            QWidget: Panel widget
+        """
+        panel = self._panels[index]
+        if panel is None:
+            panel = self._panel_factories[index]()
+            placeholder = self.content_stack.widget(index)
+            self.content_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.content_stack.insertWidget(index, panel)
+            self._panels[index] = panel
+            
+            # Panels load their data when built
+            self._dirty[index] = False
+            self._last_refresh[index] = time.monotonic()
+        return panel
+        
+    @pyqtSlot(int)
+    def switch_panel(self, index):
         """
-        # Update button states
-        if button:
-            for btn in self.nav_buttons:
-                if btn != button:
-                    btn.setChecked(False)
-            button.setChecked(True)
+        Switch to the specified panel.
         
-        # Switch panel
-        self.content_stack.setCurrentIndex(index)
+        Args:
+            index (int): Panel index
+        """
+        # Switch panel; a newly built panel has just loaded its data
+        is_new = self._panels[index] is None
+        self.content_stack.setCurrentWidget(self.get_panel(index))
         
-        # Refresh the panel data
-        self.refresh_current_panel()
+        # Refresh the panel data unless it is still up to date
+        stale = time.monotonic() - self._last_refresh[index] > PANEL_REFRESH_TTL
+        if not is_new and (self._dirty[index] or stale):
+            self._refresh_timer.start()
+        else:
+            self._refresh_timer.stop()
         
     def refresh_current_panel(self):
         """Refresh the current panel's data."""
+        index = self.content_stack.currentIndex()
         current_panel = self.content_stack.currentWidget()
         if hasattr(current_panel, 'refresh_data'):
             current_panel.refresh_data()
+            self._dirty[index] = False
+            self._last_refresh[index] = time.monotonic()
+            
+    @pyqtSlot(str, str)
+    def _mark_collection_dirty(self, collection, doc_id):
+        """
+        Mark the panel showing a changed collection as needing a refresh.
+        
+        Args:
+            collection (str): Collection that changed
+            doc_id (str): ID of the changed document
+        """
+        index = PANEL_COLLECTIONS.get(collection)
+        if index is not None:
+            self._dirty[index] = True
+            
+    @pyqtSlot(int)
+    def _mark_audit_log_dirty(self, count):
+        """
+        Mark the audit log panel as needing a refresh after entries were written.
+        
+        Args:
+            count (int): Number of entries written
+        """
+        self._dirty[PANEL_COLLECTIONS['audit_log']] = True
         
     def logout(self):
         """Handle admin logout."""
@@ -245,7 +328,7 @@ class AdminInterface(QMainWindow):
             self.logger.info(f"Admin logout: {self.admin_user.get('username')}")
             
             # Log the admin logout
-            self.db_manager.add_audit_log({
+            self.audit_batcher.enqueue({
                 'action': 'admin_logout',
                 'user_id': self.admin_user.get('id'),
                 'username': self.admin_user.get('username'),
@@ -265,6 +348,9 @@ class AdminInterface(QMainWindow):
         Args:
             event: Close event
         """
+        # Write queued audit entries, including the logout record
+        self.audit_batcher.flush()
+        
         # Emit logout signal if not already emitted
         self.logout_requested.emit()
         event.accept()
@@ -7,16 +7,114 @@ This module provides a viewer for the audit log in the admin interface.
 """
 
 import os
+import functools
 from datetime import datetime
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-                            QFrame, QTableWidget, QTableWidgetItem, QHeaderView,
+                            QFrame, QTableView, QHeaderView,
                             QSplitter, QComboBox, QDateEdit, QMessageBox)
-from PyQt6.QtCore import Qt, QDate, pyqtSlot
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QDate, QTimer, pyqtSlot, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFont, QColor, QBrush
 
 from utils.logger import get_logger
 from utils.error_handler import show_error_dialog
 
+# Audit log actions shown for each action filter choice
+ACTION_GROUPS = {
+    "Login": ("admin_login", "admin_logout", "student_login"),
+    "Faculty Update": ("add_faculty", "edit_faculty", "delete_faculty"),
+    "Student Update": ("add_student", "edit_student", "delete_student"),
+    "System": ("add_office", "edit_office", "delete_office", "consultation_request"),
+}
+
+# Action text color per action group; brushes are built once and shared by every row
+_GROUP_BRUSH = {
+    "Login": QBrush(QColor("#4A90E2")),
+    "Faculty Update": QBrush(QColor("#4ECDC4")),
+    "Student Update": QBrush(QColor("#FFD166")),
+    "System": QBrush(QColor("#FF6B6B")),
+}
+_ACTION_BRUSH = {
+    action: _GROUP_BRUSH[group]
+    for group, actions in ACTION_GROUPS.items()
+    for action in actions
+}
+
+@functools.lru_cache(maxsize=None)
+def _title_font():
+    """Panel title font, shared by every panel instance; built on first use, once the application exists."""
+    return QFont("Arial", 14, QFont.Weight.Bold)
+
+class AuditLogModel(QAbstractTableModel):
+    """
+    Table model serving audit log rows to a QTableView on demand.
+    
+    Rows are (timestamp, action, user, details, id) tuples of strings. The
+    action column is colored by its action group.
+    """
+    
+    HEADERS = ("Timestamp", "Action", "User", "Details", "ID")
+    ACTION_COLUMN = 1
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the model.
+        
+        Args:
+            parent (QObject, optional): Parent object
+        """
+        super().__init__(parent)
+        self._rows = []
+        
+    def set_rows(self, rows):
+        """
+        Replace all rows.
+        
+        Args:
+            rows (list): Row tuples
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        
+    def append_rows(self, rows):
+        """
+        Append rows to the end of the model.
+        
+        Args:
+            rows (list): Row tuples
+        """
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == self.ACTION_COLUMN:
+            return _ACTION_BRUSH.get(self._rows[index.row()][self.ACTION_COLUMN])
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=lambda row: row[column], reverse=order == Qt.SortOrder.DescendingOrder)
+        self.layoutChanged.emit()
+
 class AuditLogViewerPanel(QWidget):
     """
     Audit log viewer panel for the admin interface.
@@ -34,6 +132,31 @@ class AuditLogViewerPanel(QWidget):
         self.logger = get_logger(__name__)
         self.db_manager = db_manager
         
+        # Paging state; _results_id identifies the current filtered result set
+        self._page_size = 300
+        self._offset = 0
+        self._total = 0
+        self._results_id = None
+        
+        # Result set for the default filters (all actions, today), reused
+        # when the filters are reset until the data is refreshed
+        self._default_results_id = None
+        
+        # Coalesces bursts of refresh requests (e.g. resetting both filters) into one query
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(200)
+        self._refresh_timer.timeout.connect(self.load_page)
+        
+        # Rows of the loaded page still to be added to the table, a chunk per event-loop pass
+        self._chunk_size = 50
+        self._pending_rows = []
+        self._pending_pos = 0
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_next_chunk)
+        
         # Initialize UI
         self.init_ui()
         
@@ -51,7 +174,7 @@ class AuditLogViewerPanel(QWidget):
         header_layout = QHBoxLayout()
         title = QLabel("Audit Log")
         title.setObjectName("panel-header")
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        title.setFont(_title_font())
         header_layout.addWidget(title)
         
         # Spacer
@@ -90,43 +213,111 @@ class AuditLogViewerPanel(QWidget):
         
         main_layout.addLayout(header_layout)
         
-        # Log table
-        self.log_table = QTableWidget()
-        self.log_table.setColumnCount(5)
-        self.log_table.setHorizontalHeaderLabels(["Timestamp", "Action", "User", "Details", "ID"])
+        # Log table; the model serves cells on demand instead of one item per cell
+        self._model = AuditLogModel(self)
+        self.log_table = QTableView()
+        self.log_table.setModel(self._model)
         self.log_table.verticalHeader().setVisible(False)
         self.log_table.setAlternatingRowColors(True)
         self.log_table.setSortingEnabled(True)
-        self.log_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.log_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.log_table.sortByColumn(0, Qt.SortOrder.DescendingOrder)  # Newest first
+        self.log_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.log_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         
-        # Set column widths
+        # Set column widths; columns are sized to the first page, not re-measured on every load
         header = self.log_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)  # Details column stretches
+        self._columns_sized = False
         
         # Hide ID column - used for reference only
         self.log_table.setColumnHidden(4, True)
         
         main_layout.addWidget(self.log_table)
         
-        # Status label
+        # Status label and paging controls
+        footer_layout = QHBoxLayout()
         self.status_label = QLabel("Ready")
-        main_layout.addWidget(self.status_label)
+        footer_layout.addWidget(self.status_label)
+        footer_layout.addStretch()
+        
+        self.prev_button = QPushButton("Previous")
+        self.prev_button.clicked.connect(self.previous_page)
+        footer_layout.addWidget(self.prev_button)
+        
+        self.next_button = QPushButton("Next")
+        self.next_button.clicked.connect(self.next_page)
+        footer_layout.addWidget(self.next_button)
+        
+        main_layout.addLayout(footer_layout)
         
     @pyqtSlot()
     def refresh_data(self):
-        """Refresh audit log data from the database."""
+        """
+        Refresh audit log data from the database, starting a new result set.
+        
+        The query runs once no further refresh has been requested for 200 ms.
+        """
+        self._offset = 0
+        self._results_id = None
+        self._default_results_id = None
+        self._refresh_timer.start()
+        
+    def _filters_are_default(self):
+        """
+        Check whether the filters are at their default values.
+        
+        Returns:
+            bool: True for all actions on today's date
+        """
+        return (self.action_filter.currentIndex() == 0
+                and self.date_filter.date() == QDate.currentDate())
+        
+    @pyqtSlot()
+    def previous_page(self):
+        """Show the previous page of the current result set."""
+        self._offset = max(0, self._offset - self._page_size)
+        self.load_page()
+        
+    @pyqtSlot()
+    def next_page(self):
+        """Show the next page of the current result set."""
+        if self._offset + self._page_size < self._total:
+            self._offset += self._page_size
+            self.load_page()
+        
+    def load_page(self):
+        """Load the page at the current offset and show it in the table."""
         self.logger.info("Refreshing audit log data")
+        self._refresh_timer.stop()
         self.status_label.setText("Loading audit log...")
         
         try:
-            # Clear table
-            self.log_table.setRowCount(0)
+            self._total, self._results_id, logs = self.db_manager.query_audit_logs(
+                actions=ACTION_GROUPS.get(self.action_filter.currentText()),
+                date=self.date_filter.date().toPyDate(),
+                offset=self._offset,
+                limit=self._page_size,
+                cache_id=self._results_id
+            )
+            if self._filters_are_default():
+                self._default_results_id = self._results_id
             
-            # In a real implementation, you would load data from db_manager
-            # For demonstration, show a placeholder message
-            self.status_label.setText("Ready - Audit log functionality will be implemented here")
+            # Rows are added in chunks so the UI keeps painting and taking input
+            self._model.set_rows([])
+            self._pending_rows = logs
+            self._pending_pos = 0
+            self._render_next_chunk()
+            
+            # Update paging controls
+            self.prev_button.setEnabled(self._offset > 0)
+            self.next_button.setEnabled(self._offset + len(logs) < self._total)
+            if logs:
+                self.status_label.setText(
+                    f"Showing {self._offset + 1}-{self._offset + len(logs)} of {self._total} entries"
+                )
+            else:
+                self.status_label.setText("No audit log entries found")
             
         except Exception as e:
             self.logger.error(f"Error refreshing audit log data: {e}")
@@ -137,6 +328,36 @@ class AuditLogViewerPanel(QWidget):
             )
             self.status_label.setText("Error loading audit log data")
         
+    @pyqtSlot()
+    def _render_next_chunk(self):
+        """Add the next chunk of pending rows to the table."""
+        start = self._pending_pos
+        chunk = self._pending_rows[start:start + self._chunk_size]
+        self._pending_pos = start + len(chunk)
+        
+        self._model.append_rows([
+            (log.get('timestamp', ''),
+             log.get('action', ''),
+             str(log.get('username') or log.get('user_id', '')),
+             str(log.get('details', '')),
+             str(log.get('id', '')))
+            for log in chunk
+        ])
+        
+        if chunk and not self._columns_sized:
+            for column in range(3):
+                self.log_table.resizeColumnToContents(column)
+            self._columns_sized = True
+            
+        if self._pending_pos < len(self._pending_rows):
+            self._render_timer.start()
+        else:
+            self._pending_rows = []
+            
+            # Keep the view's current sort order for the new page
+            header = self.log_table.horizontalHeader()
+            self._model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        
     @pyqtSlot()
     def apply_filters(self):
         """Apply filters to the audit log data."""
@@ -145,10 +366,18 @@ class AuditLogViewerPanel(QWidget):
             date_filter = self.date_filter.date().toString("yyyy-MM-dd")
             
             self.logger.info(f"Applying filters: Action={action_filter}, Date={date_filter}")
-            self.status_label.setText(f"Filtering: {action_filter} on {date_filter}")
             
-            # In a real implementation, you would apply filters to the data
-            # For now, just acknowledge the filter change
+            # Back at the defaults, page through the result set already counted
+            if self._filters_are_default() and self._default_results_id:
+                self._offset = 0
+                self._results_id = self._default_results_id
+                self._refresh_timer.start()
+                return
+                
+            # New filters mean a new result set
+            self._offset = 0
+            self._results_id = None
+            self._refresh_timer.start()
             
         except Exception as e:
             self.logger.error(f"Error applying filters: {e}")
@@ -161,7 +390,7 @@ class AuditLogViewerPanel(QWidget):
             self.action_filter.setCurrentIndex(0)  # All Actions
             self.date_filter.setDate(QDate.currentDate())
             self.status_label.setText("Filters reset to defaults")
-            self.refresh_data()
+            self.apply_filters()
             
         except Exception as e:
             self.logger.error(f"Error resetting filters: {e}")
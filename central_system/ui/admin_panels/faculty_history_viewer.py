@@ -7,30 +7,73 @@ This module provides a dialog for viewing faculty status history.
 """
 
 import os
+from dataclasses import dataclass
 from datetime import datetime
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QTableWidget, QTableWidgetItem,
                             QHeaderView, QComboBox, QDateEdit, QDialogButtonBox,
                             QFormLayout, QFrame)
 from PyQt6.QtCore import Qt, QDateTime
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QBrush
 from utils.logger import get_logger
+from data.database import to_naive_local
+
+# Status colors: green, amber, and red for unavailable or anything else
+_STATUS_COLOR_HEX = {'available': '#4ECDC4', 'busy': '#FFD166'}
+_DEFAULT_STATUS_COLOR_HEX = '#FF6B6B'
+
+# Brushes are built once and shared by every row
+_STATUS_BRUSH = {status: QBrush(QColor(color)) for status, color in _STATUS_COLOR_HEX.items()}
+_DEFAULT_STATUS_BRUSH = QBrush(QColor(_DEFAULT_STATUS_COLOR_HEX))
+
+# Most entries shown for one filter setting; the newest are kept
+HISTORY_LIMIT = 500
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    """A faculty status change, converted once from its database dict."""
+    __slots__ = ('timestamp', 'display_time', 'status', 'reason')
+    
+    timestamp: datetime
+    display_time: str
+    status: str
+    reason: str
 
 class FacultyHistoryViewer(QDialog):
     """Dialog for viewing faculty status history."""
     
-    def __init__(self, faculty, parent=None):
+    def __init__(self, faculty, db_manager, history=None, parent=None):
         """
         Initialize the faculty history viewer.
         
         Args:
-            faculty (dict): Faculty data including status history
+            faculty (dict): Faculty data
+            db_manager: Database manager instance
+            history (list, optional): Status history already fetched for this
+                faculty member; the history in the faculty data is used if None
             parent: Parent widget
         """
         super().__init__(parent)
         self.logger = get_logger(__name__)
         self.faculty = faculty
-        self.history = faculty.get('status_history', [])
+        self.db_manager = db_manager
+        
+        # The history snapshot loaded with the faculty list (or prefetched)
+        # answers the unfiltered view without a query; _min_ts/_max_ts bound its range
+        if history is None:
+            history = faculty.get('status_history', [])
+        self._all_sorted_cache = sorted(
+            self._parse_history(history),
+            key=lambda entry: entry.timestamp,
+            reverse=True
+        )
+        if self._all_sorted_cache:
+            self._max_ts = self._all_sorted_cache[0].timestamp
+            self._min_ts = self._all_sorted_cache[-1].timestamp
+            
+        # Query results by (start, end, status) as (entries, truncated),
+        # valid while this history is shown
+        self._filter_cache = {}
         
         self.setWindowTitle(f"Status History - {faculty.get('name', '')}")
         self.setMinimumSize(600, 400)
@@ -61,12 +104,9 @@ class FacultyHistoryViewer(QDialog):
         status_label = QLabel(current_status.capitalize())
         
         # Set color based on status
-        if current_status == 'available':
-            status_label.setStyleSheet("color: #4ECDC4;")  # Green
-        elif current_status == 'busy':
-            status_label.setStyleSheet("color: #FFD166;")  # Amber
-        else:
-            status_label.setStyleSheet("color: #FF6B6B;")  # Red
+        status_label.setStyleSheet(
+            f"color: {_STATUS_COLOR_HEX.get(current_status, _DEFAULT_STATUS_COLOR_HEX)};"
+        )
             
         info_layout.addRow("Current Status:", status_label)
         
@@ -112,108 +152,124 @@ class FacultyHistoryViewer(QDialog):
         self.history_table.verticalHeader().setVisible(False)
         main_layout.addWidget(self.history_table)
         
+        # Shown when more entries match than are listed
+        self.truncated_label = QLabel(
+            f"Showing the newest {HISTORY_LIMIT} matching entries. "
+            "Narrow the date range to see older ones."
+        )
+        self.truncated_label.setVisible(False)
+        main_layout.addWidget(self.truncated_label)
+        
         # Dialog buttons
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
         main_layout.addWidget(button_box)
         
+    def _parse_history(self, history):
+        """
+        Convert history entries from the database into HistoryEntry objects.
+        
+        Args:
+            history (list): Status history entries, newest first
+            
+        Returns:
+            list: HistoryEntry objects in the same order, without entries
+                that have no valid timestamp
+        """
+        entries = []
+        for entry in history:
+            # Compare everything as naive local time; entries without a
+            # valid timestamp are skipped without raising
+            dt = to_naive_local(entry.get('timestamp'))
+            if dt is None:
+                continue
+            entries.append(HistoryEntry(
+                dt,
+                dt.strftime('%Y-%m-%d %H:%M:%S'),
+                entry.get('status', 'unknown'),
+                entry.get('reason', '')
+            ))
+            
+        return entries
+        
     def populate_history(self):
         """Populate the history table with faculty status history."""
         # Clear table
         self.history_table.setRowCount(0)
         
-        # Get filtered history
-        filtered_history = self.get_filtered_history()
+        # Get filtered history, already newest first
+        filtered_history, truncated = self.get_filtered_history()
+        self.truncated_label.setVisible(truncated)
         
         if not filtered_history:
             self.logger.warning("No status history available")
             return
             
-        # Sort by timestamp (newest first)
-        filtered_history.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            
-        # Add history entries to table
-        self.history_table.setRowCount(len(filtered_history))
-        for row, entry in enumerate(filtered_history):
-            # Timestamp
-            timestamp = entry.get('timestamp', '')
-            try:
-                # Format timestamp for display
-                dt = datetime.fromisoformat(timestamp)
-                timestamp_str = dt.strftime('%Y-%m-%d %H:%M:%S')
-            except:
-                timestamp_str = timestamp
+        # Add history entries to table, repainting once at the end
+        table = self.history_table
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(filtered_history))
+            for row, entry in enumerate(filtered_history):
+                # Timestamp
+                timestamp_item = QTableWidgetItem(entry.display_time)
+                table.setItem(row, 0, timestamp_item)
                 
-            timestamp_item = QTableWidgetItem(timestamp_str)
-            self.history_table.setItem(row, 0, timestamp_item)
-            
-            # Status
-            status = entry.get('status', 'unknown')
-            status_item = QTableWidgetItem(status.capitalize())
-            
-            # Set color based on status
-            if status == 'available':
-                status_item.setForeground(QColor('#4ECDC4'))  # Green
-            elif status == 'busy':
-                status_item.setForeground(QColor('#FFD166'))  # Amber
-            else:
-                status_item.setForeground(QColor('#FF6B6B'))  # Red
+                # Status
+                status = entry.status
+                status_item = QTableWidgetItem(status.capitalize())
                 
-            self.history_table.setItem(row, 1, status_item)
-            
-            # Reason
-            reason = entry.get('reason', '')
-            reason_item = QTableWidgetItem(reason)
-            self.history_table.setItem(row, 2, reason_item)
+                # Set color based on status
+                status_item.setForeground(_STATUS_BRUSH.get(status, _DEFAULT_STATUS_BRUSH))
+                table.setItem(row, 1, status_item)
+                
+                # Reason
+                reason_item = QTableWidgetItem(entry.reason)
+                table.setItem(row, 2, reason_item)
+        finally:
+            table.setUpdatesEnabled(True)
             
     def get_filtered_history(self):
         """
         Get filtered status history based on current filter settings.
         
+        The filters are applied by the database, which returns only the
+        matching page, unless they would match every entry of the history
+        the dialog was opened with. Each filter setting is queried once.
+        At most HISTORY_LIMIT entries are returned.
+        
         Returns:
-            list: Filtered status history
+            tuple: (matching HistoryEntry objects, newest first, and whether
+                older matching entries were left out)
         """
-        # Start with all history
-        filtered = self.history[:]
+        start_date = self.start_date.dateTime().toPyDateTime()
+        end_date = self.end_date.dateTime().toPyDateTime()
         
-        # Apply date filter
-        start_date = self.start_date.dateTime().toPython()
-        end_date = self.end_date.dateTime().toPython()
-        
-        filtered = [
-            entry for entry in filtered 
-            if self.entry_in_date_range(entry, start_date, end_date)
-        ]
-        
-        # Apply status filter
-        status_filter = self.status_filter.currentText().lower()
-        if status_filter != "all statuses":
-            filtered = [
-                entry for entry in filtered 
-                if entry.get('status', '') == status_filter
-            ]
+        # All statuses over a range spanning the whole history filters nothing out
+        if (self.status_filter.currentIndex() == 0 and self._all_sorted_cache
+                and start_date <= self._min_ts and end_date >= self._max_ts):
+            return self._all_sorted_cache[:HISTORY_LIMIT], len(self._all_sorted_cache) > HISTORY_LIMIT
             
-        return filtered
-        
-    def entry_in_date_range(self, entry, start_date, end_date):
-        """
-        Check if an entry's timestamp is within the specified date range.
+        status_filter = self.status_filter.currentText().lower()
         
-        Args:
-            entry (dict): History entry
-            start_date (datetime): Start date
-            end_date (datetime): End date
+        # Switching back to an earlier filter reuses its result
+        cache_key = (start_date, end_date, status_filter)
+        filtered = self._filter_cache.get(cache_key)
+        if filtered is None:
+            # One entry past the limit tells whether any were left out
+            history = self.db_manager.get_faculty_history(
+                self.faculty.get('id'),
+                start_date,
+                end_date,
+                None if status_filter == "all statuses" else status_filter,
+                0,
+                HISTORY_LIMIT + 1
+            )
+            filtered = (self._parse_history(history[:HISTORY_LIMIT]), len(history) > HISTORY_LIMIT)
+            self._filter_cache[cache_key] = filtered
             
-        Returns:
-            bool: True if entry is within range, False otherwise
-        """
-        try:
-            timestamp = entry.get('timestamp', '')
-            entry_date = datetime.fromisoformat(timestamp)
-            return start_date <= entry_date <= end_date
-        except:
-            return False
+        return filtered
             
     def apply_filter(self):
         """Apply current filter settings and update the display."""
-        self.populate_history() 
\ No newline at end of file
+        self.populate_history()
@@ -6,22 +6,23 @@ ConsultEase - Faculty Manager Panel
 This module provides a panel for managing faculty information in the admin interface.
 """
 
-import os
+import re
+import time
+import bisect
 from datetime import datetime
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QPushButton, QFrame, QLineEdit, QComboBox, 
-                            QFormLayout, QTableWidget, QTableWidgetItem,
-                            QHeaderView, QDialog, QMessageBox, QSpacerItem,
-                            QSizePolicy, QCheckBox, QGroupBox, QDialogButtonBox)
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor
+                            QPushButton, QLineEdit, QComboBox, QTableView,
+                            QHeaderView, QDialog, QMessageBox)
+from PyQt6.QtCore import (Qt, QTimer, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel, QObject, QRunnable, QThreadPool,
+                          QSignalBlocker, pyqtSignal)
+from PyQt6.QtGui import QColor, QBrush
 
 from utils.logger import get_logger
-from utils.error_handler import show_error_dialog, show_warning_dialog, show_confirmation_dialog
-from data.models import Faculty
+from utils.error_handler import show_error_dialog, show_warning_dialog
 
 # List of common academic departments
-COMMON_DEPARTMENTS = [
+COMMON_DEPARTMENTS = (
     "Computer Science",
     "Information Technology",
     "Electrical Engineering",
@@ -48,7 +49,26 @@ COMMON_DEPARTMENTS = [
     "Law",
     "Architecture",
     "Other"
-]
+)
+
+# Combo box index of each common department; "Custom..." follows them
+_DEPT_INDEX = {dept: index for index, dept in enumerate(COMMON_DEPARTMENTS)}
+_CUSTOM_DEPT_INDEX = len(COMMON_DEPARTMENTS)
+
+# Status column brushes, built once and shared by every row: green for
+# available, red for anything else (from theme)
+_BRUSH_AVAILABLE = QBrush(QColor('#4ECDC4'))
+_BRUSH_UNAVAILABLE = QBrush(QColor('#FF6B6B'))
+
+# Faculty rows loaded per query; further pages load as the table is scrolled
+FACULTY_PAGE_SIZE = 200
+
+# Seconds a loaded faculty list is reused; status changes made elsewhere,
+# e.g. by faculty desk units, do not change the local change token
+FACULTY_CACHE_TTL = 30
+
+# BLE beacon MAC address, e.g. AA:BB:CC:DD:EE:FF
+_BLE_RE = re.compile(r'[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}')
 
 class FacultyDialog(QDialog):
     """
@@ -65,10 +85,17 @@ class FacultyDialog(QDialog):
         """
         super().__init__(parent)
         self.faculty = faculty
+        
+        # Form data, set once the dialog is accepted
+        self._data = None
+        
         self.init_ui()
         
     def init_ui(self):
         """Initialize the user interface."""
+        # Only the dialog uses these; imported when it is first built
+        from PyQt6.QtWidgets import QFormLayout, QDialogButtonBox
+        
         # Set dialog properties
         self.setWindowTitle("Faculty Information")
         self.setMinimumWidth(400)
@@ -93,10 +120,9 @@ class FacultyDialog(QDialog):
         self.dept_combo.setEditable(True)  # Allow custom departments
         self.dept_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)  # Don't add new items to list
         
-        # Add common departments
-        for dept in COMMON_DEPARTMENTS:
-            self.dept_combo.addItem(dept)
-            
+        # Add common departments in one insert
+        self.dept_combo.addItems(COMMON_DEPARTMENTS)
+        
         # Add custom department option
         self.dept_combo.addItem("Custom...")
         self.dept_combo.currentTextChanged.connect(self._handle_department_selection)
@@ -157,16 +183,14 @@ class FacultyDialog(QDialog):
             
             # Find the department in the list or set custom
             department = self.faculty.get('department', '')
-            index = self.dept_combo.findText(department)
-            if index >= 0:
+            index = _DEPT_INDEX.get(department)
+            if index is not None:
                 self.dept_combo.setCurrentIndex(index)
             else:
                 # Set to custom and fill in the custom field
-                custom_index = self.dept_combo.findText("Custom...")
-                if custom_index >= 0:
-                    self.dept_combo.setCurrentIndex(custom_index)
-                    self.custom_dept_input.setText(department)
-                    self.custom_dept_input.setVisible(True)
+                self.dept_combo.setCurrentIndex(_CUSTOM_DEPT_INDEX)
+                self.custom_dept_input.setText(department)
+                self.custom_dept_input.setVisible(True)
             
             self.email_input.setText(self.faculty.get('email', ''))
             self.phone_input.setText(self.faculty.get('phone', ''))
@@ -185,24 +209,48 @@ class FacultyDialog(QDialog):
             
     def get_faculty_data(self):
         """
-        Get faculty data from the form.
+        Get the faculty data entered in the form.
         
         Returns:
-            dict: Faculty data
+            dict: Faculty data, or None if the dialog was not accepted
         """
-        # Get department (from combo or custom input)
-        if self.dept_combo.currentText() == "Custom...":
-            department = self.custom_dept_input.text().strip()
-        else:
-            department = self.dept_combo.currentText().strip()
+        return self._data
+        
+    def _extract(self):
+        """
+        Read and validate the form, reading each field once.
+        
+        Returns:
+            tuple: (faculty data, None) if valid, otherwise
+                (None, (message, details)) describing the first problem
+        """
+        # Name is required
+        name = self.name_input.text().strip()
+        if not name:
+            return None, ("Name is required.", "Please enter a name for the faculty member.")
+            
+        # Department is required (from combo or custom input)
+        department = self.dept_combo.currentText()
+        if department == "Custom...":
+            department = self.custom_dept_input.text()
+        department = department.strip()
+        if not department:
+            return None, ("Department is required.",
+                          "Please select or enter a department for the faculty member.")
+            
+        # BLE Beacon ID format validation (simple check)
+        ble_id = self.ble_input.text().strip()
+        if ble_id and not self._validate_ble_id(ble_id):
+            return None, ("Invalid BLE Beacon ID format.",
+                          "BLE Beacon ID should be in the format AA:BB:CC:DD:EE:FF.")
             
         faculty_data = {
-            'name': self.name_input.text().strip(),
+            'name': name,
             'department': department,
             'email': self.email_input.text().strip(),
             'phone': self.phone_input.text().strip(),
             'office': self.office_input.text().strip(),
-            'ble_beacon_id': self.ble_input.text().strip(),
+            'ble_beacon_id': ble_id,
             'status': 'available' if self.status_combo.currentText() == 'Available' else 'unavailable',
             'last_updated': datetime.now().isoformat()
         }
@@ -211,77 +259,355 @@ class FacultyDialog(QDialog):
         if self.faculty and 'id' in self.faculty:
             faculty_data['id'] = self.faculty['id']
             
-        return faculty_data
+        return faculty_data, None
         
-    def validate(self):
+    def _validate_ble_id(self, ble_id):
         """
-        Validate the form.
+        Validate BLE Beacon ID format.
         
+        Args:
+            ble_id (str): BLE Beacon ID
+            
         Returns:
             bool: True if valid, False otherwise
         """
-        # Name is required
-        if not self.name_input.text().strip():
-            show_warning_dialog(
-                title="Validation Error", 
-                message="Name is required.",
-                details="Please enter a name for the faculty member."
-            )
-            return False
+        return _BLE_RE.fullmatch(ble_id) is not None
+        
+    def accept(self):
+        """Handle dialog acceptance."""
+        faculty_data, error = self._extract()
+        if error:
+            message, details = error
+            show_warning_dialog(title="Validation Error", message=message, details=details)
+            return
             
-        # Department is required
-        department = ""
-        if self.dept_combo.currentText() == "Custom...":
-            department = self.custom_dept_input.text().strip()
-        else:
-            department = self.dept_combo.currentText().strip()
+        self._data = faculty_data
+        super().accept()
+
+class _DbTaskSignals(QObject):
+    """
+    Signals of a _DbTask, delivered on the thread that created the task.
+    
+    Signals:
+        finished (object): Emitted with the call's return value
+        failed (str): Emitted with the error message if the call raised
+    """
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    
+class _DbTask(QRunnable):
+    """Runs a database call on the global thread pool."""
+    
+    def __init__(self, func, *args):
+        """
+        Initialize the task.
+        
+        Args:
+            func (callable): Function to call
+            *args: Arguments for the function
+        """
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = _DbTaskSignals()
+        
+    def run(self):
+        """Call the function and report the outcome through the signals."""
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+        
+class FacultyTableModel(QAbstractTableModel):
+    """
+    Table model serving faculty rows to a QTableView on demand.
+    
+    The faculty dicts from the database are the model's storage; cell text
+    is looked up only when the view asks for it. Rows are loaded a page at
+    a time: when the view scrolls past the last row and the database has
+    more, more_requested is emitted and the owner appends the next page.
+    
+    Signals:
+        more_requested: Emitted when the view needs the next page of rows
+    """
+    more_requested = pyqtSignal()
+    
+    HEADERS = ("ID", "Name", "Department", "Email", "Office", "BLE ID", "Status")
+    KEYS = ('id', 'name', 'department', 'email', 'office', 'ble_beacon_id', 'status')
+    STATUS_COLUMN = 6
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the model.
+        
+        Args:
+            parent (QObject, optional): Parent object
+        """
+        super().__init__(parent)
+        self._rows = []
+        
+        # Display text per row, built once so data() is a tuple lookup
+        self._rows_display = []
+        
+        # Lowercased (name, email, status) per row, for filtering without re-lowering
+        self._rows_lc = []
+        
+        # Whether the database has rows past the loaded ones, and whether
+        # the next page has been requested
+        self._more = False
+        self._fetching = False
+        
+    @classmethod
+    def _display(cls, faculty):
+        """
+        Get the display text of every column of a faculty row.
+        
+        Args:
+            faculty (dict): Faculty data
             
-        if not department:
-            show_warning_dialog(
-                title="Validation Error", 
-                message="Department is required.",
-                details="Please select or enter a department for the faculty member."
-            )
-            return False
+        Returns:
+            tuple: Cell text in column order
+        """
+        cells = [faculty.get(key, '') for key in cls.KEYS]
+        cells[cls.STATUS_COLUMN] = faculty.get('status', 'unavailable').capitalize()
+        return tuple(cells)
+        
+    @staticmethod
+    def _lowered(faculty):
+        """
+        Get the lowercased fields a faculty row is filtered on.
+        
+        Args:
+            faculty (dict): Faculty data
             
-        # BLE Beacon ID format validation (simple check)
-        ble_id = self.ble_input.text().strip()
-        if ble_id and not self._validate_ble_id(ble_id):
-            show_warning_dialog(
-                title="Validation Error", 
-                message="Invalid BLE Beacon ID format.",
-                details="BLE Beacon ID should be in the format AA:BB:CC:DD:EE:FF."
-            )
-            return False
+        Returns:
+            tuple: (name, email, status), lowercased
+        """
+        return (faculty.get('name', '').lower(),
+                faculty.get('email', '').lower(),
+                faculty.get('status', 'unavailable').lower())
+        
+    def set_rows(self, rows, more=False):
+        """
+        Replace all rows.
+        
+        Args:
+            rows (list): Faculty data dicts
+            more (bool, optional): Whether the database has more rows to page in
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._rows_display = [self._display(faculty) for faculty in rows]
+        self._rows_lc = [self._lowered(faculty) for faculty in rows]
+        self._more = more
+        self._fetching = False
+        self.endResetModel()
+        
+    def append_rows(self, rows, more):
+        """
+        Append a page of faculty members requested through more_requested.
+        
+        Args:
+            rows (list): Faculty data dicts
+            more (bool): Whether the database has more rows after these
+        """
+        self._more = more
+        self._fetching = False
+        if not rows:
+            return
             
-        return True
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._rows_display.extend(self._display(faculty) for faculty in rows)
+        self._rows_lc.extend(self._lowered(faculty) for faculty in rows)
+        self.endInsertRows()
         
-    def _validate_ble_id(self, ble_id):
+    def cancel_fetch(self):
+        """Allow the next page to be requested again after a request was dropped."""
+        self._fetching = False
+        
+
+    def append_row(self, faculty):
         """
-        Validate BLE Beacon ID format.
+        Append one faculty member to the end of the model.
         
         Args:
-            ble_id (str): BLE Beacon ID
+            faculty (dict): Faculty data
+        """
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(faculty)
+        self._rows_display.append(self._display(faculty))
+        self._rows_lc.append(self._lowered(faculty))
+        self.endInsertRows()
+        
+    def row_changed(self, row):
+        """
+        Notify views that a row's faculty data was changed in place.
+        
+        Args:
+            row (int): Row number
+        """
+        self._rows_display[row] = self._display(self._rows[row])
+        self._rows_lc[row] = self._lowered(self._rows[row])
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        
+    def remove_row(self, row):
+        """
+        Remove one faculty member from the model.
+        
+        Args:
+            row (int): Row number
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._rows_display[row]
+        del self._rows_lc[row]
+        self.endRemoveRows()
+        
+    def row_of(self, faculty):
+        """
+        Find the row holding a faculty data dict.
+        
+        Args:
+            faculty (dict): Faculty data, as returned by faculty_at()
             
         Returns:
-            bool: True if valid, False otherwise
+            int: Row number, or -1 if the dict is not in the model
         """
-        # Simple format check (could be more sophisticated)
-        parts = ble_id.split(':')
-        if len(parts) != 6:
-            return False
+        for row, candidate in enumerate(self._rows):
+            if candidate is faculty:
+                return row
+        return -1
+        
+    def all_rows(self):
+        """
+        Get the faculty data of every row.
+        
+        Returns:
+            list: Faculty data dicts, in row order
+        """
+        return self._rows
+        
+    def lowered_at(self, row):
+        """
+        Get the lowercased name, email and status of a row.
+        
+        Args:
+            row (int): Row number
             
-        for part in parts:
-            if len(part) != 2 or not all(c in '0123456789ABCDEFabcdef' for c in part):
-                return False
-                
+        Returns:
+            tuple: (name, email, status), lowercased
+        """
+        return self._rows_lc[row]
+        
+    def faculty_at(self, row):
+        """
+        Get the faculty data shown in a row.
+        
+        Args:
+            row (int): Row number
+            
+        Returns:
+            dict: Faculty data
+        """
+        return self._rows[row]
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._more and not self._fetching
+        
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._fetching = True
+            self.more_requested.emit()
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows_display[index.row()][column]
+        if role == Qt.ItemDataRole.ForegroundRole and column == self.STATUS_COLUMN:
+            if self._rows[index.row()].get('status') == 'available':
+                return _BRUSH_AVAILABLE
+            return _BRUSH_UNAVAILABLE
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+class FacultyFilterProxy(QSortFilterProxyModel):
+    """
+    Proxy model hiding faculty rows that do not match the panel's filters.
+    
+    Rows are matched on the source model's faculty dicts, not on cell text.
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the proxy.
+        
+        Args:
+            parent (QObject, optional): Parent object
+        """
+        super().__init__(parent)
+        self.dept = ""
+        self.status = ""
+        self.search = ""
+        
+    def set_filters(self, dept, status, search):
+        """
+        Set the filter values and re-filter the rows.
+        
+        Args:
+            dept (str): Department to show, empty for all
+            status (str): Lowercase status to show, empty for all
+            search (str): Lowercase text to find in name or email, empty for all
+        """
+        self.dept = dept
+        self.status = status
+        self.search = search
+        self.invalidateFilter()
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        if self.dept and model.faculty_at(source_row).get('department', '') != self.dept:
+            return False
+        name, email, status = model.lowered_at(source_row)
+        if self.status and status != self.status:
+            return False
+        if self.search:
+            return self.search in name or self.search in email
         return True
         
-    def accept(self):
-        """Handle dialog acceptance."""
-        if self.validate():
-            super().accept()
-
+class _SampledTableView(QTableView):
+    """Table view that sizes columns to a sample of rows instead of measuring every row."""
+    
+    SAMPLE_ROWS = 30
+    PADDING = 16
+    
+    def sizeHintForColumn(self, column):
+        model = self.model()
+        if model is None:
+            return -1
+        metrics = self.fontMetrics()
+        widths = [
+            metrics.horizontalAdvance(str(model.data(model.index(row, column)) or ''))
+            for row in range(min(self.SAMPLE_ROWS, model.rowCount()))
+        ]
+        return max(widths, default=0) + self.PADDING
+        
 class FacultyManagerPanel(QWidget):
     """
     Faculty management panel for the admin interface.
@@ -289,19 +615,43 @@ class FacultyManagerPanel(QWidget):
     Provides functionality for managing faculty members (add, edit, delete).
     """
     
-    def __init__(self, db_manager, mqtt_client, parent=None):
+    def __init__(self, db_manager, mqtt_client, audit_batcher, parent=None):
         """
         Initialize the faculty manager panel.
         
         Args:
             db_manager: Database manager instance
             mqtt_client: MQTT client instance
+            audit_batcher (AuditLogBatcher): Batcher audit log entries are queued on
             parent: Parent widget
         """
         super().__init__(parent)
         self.logger = get_logger(__name__)
         self.db_manager = db_manager
         self.mqtt_client = mqtt_client
+        self.audit_batcher = audit_batcher
+        
+        # Departments currently listed in the department filter
+        self._last_depts = frozenset()
+        
+        # Background database tasks; kept referenced until they report back
+        self._tasks = set()
+        self._load_in_flight = False
+        self._reload_requested = False
+        
+        # Database rows loaded into the shown list so far, i.e. the offset of
+        # the next page, and a counter telling pages of a replaced list apart
+        self._page_offset = 0
+        self._list_generation = 0
+        
+        # IDs of faculty whose status history is being prefetched
+        self._history_prefetching = set()
+        
+        # (change token, department, status) the shown faculty list was loaded
+        # with and when; the list is reused while none of them changes, for
+        # at most FACULTY_CACHE_TTL seconds
+        self._cache_key = None
+        self._cache_ts = 0.0
         
         # Initialize UI
         self.init_ui()
@@ -340,10 +690,16 @@ class FacultyManagerPanel(QWidget):
         filter_layout.addWidget(QLabel("Search:"))
         filter_layout.addWidget(self.search_input)
         
+        # Keystrokes in the search box are coalesced into one filter pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.apply_filters)
+        
         # Connect signals
-        self.dept_filter.currentIndexChanged.connect(self.apply_filters)
-        self.status_filter.currentIndexChanged.connect(self.apply_filters)
-        self.search_input.textChanged.connect(self.apply_filters)
+        self.dept_filter.currentIndexChanged.connect(self._on_query_filter_changed)
+        self.status_filter.currentIndexChanged.connect(self._on_query_filter_changed)
+        self.search_input.textChanged.connect(self._search_timer.start)
         
         # Add filter layout to header
         header_layout.addLayout(filter_layout)
@@ -377,151 +733,361 @@ class FacultyManagerPanel(QWidget):
         button_layout.addStretch()
         
         self.refresh_button = QPushButton("Refresh")
-        self.refresh_button.clicked.connect(self.refresh_data)
+        self.refresh_button.clicked.connect(lambda: self.refresh_data(force=True))
         button_layout.addWidget(self.refresh_button)
         
         main_layout.addLayout(button_layout)
         
-        # Faculty table
-        self.faculty_table = QTableWidget()
-        self.faculty_table.setColumnCount(7)
-        
-        self.faculty_table.setHorizontalHeaderLabels([
-            "ID", "Name", "Department", "Email", "Office", "BLE ID", "Status"
-        ])
-        self.faculty_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Faculty table; the model serves cells on demand instead of one item per cell,
+        # and the proxy shows only the rows matching the filters
+        self.faculty_model = FacultyTableModel(self)
+        self.faculty_proxy = FacultyFilterProxy(self)
+        self.faculty_proxy.setSourceModel(self.faculty_model)
+        self.faculty_model.more_requested.connect(self._load_next_page)
+        self.faculty_table = _SampledTableView()
+        self.faculty_table.setModel(self.faculty_proxy)
+        
+        # Fixed starting widths instead of Stretch, which re-measures every
+        # section on each change; only the Status column takes the slack.
+        # Columns are fitted to the first loaded rows once
+        header = self.faculty_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column, width in enumerate((80, 180, 160, 200, 100, 150)):
+            header.resizeSection(column, width)
+        header.setStretchLastSection(True)
+        self._columns_sized = False
         self.faculty_table.verticalHeader().setVisible(False)
-        self.faculty_table.itemSelectionChanged.connect(self.handle_faculty_selection)
+        self.faculty_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.faculty_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.faculty_table.selectionModel().selectionChanged.connect(self.handle_faculty_selection)
         main_layout.addWidget(self.faculty_table)
         
-    def refresh_data(self):
-        """Refresh faculty data from the database."""
+    def refresh_data(self, force=False):
+        """
+        Refresh faculty data from the database.
+        
+        The department and status filters are part of the query; the search
+        text is matched locally by the proxy so typing does not query.
+        Nothing is loaded if neither those filters nor any faculty data
+        written through the database manager changed since the shown list
+        was loaded less than FACULTY_CACHE_TTL seconds ago, unless forced.
+        Otherwise the query runs on the thread pool and the table is
+        updated when it returns. Only the first page
+        is loaded; the rest are loaded as the table is scrolled. A refresh
+        requested meanwhile runs once the current one is done.
+        
+        Args:
+            force (bool, optional): Reload even if the shown list is up to date
+        """
+        if self._load_in_flight:
+            self._reload_requested = True
+            return
+            
+        dept, status = self._query_filters()
+        key = (self.db_manager.faculty_change_token(), dept, status)
+        if (not force and key == self._cache_key
+                and time.monotonic() - self._cache_ts < FACULTY_CACHE_TTL):
+            self.logger.info("Faculty data unchanged, keeping the loaded list")
+            return
+            
         self.logger.info("Refreshing faculty data")
+        self._load_in_flight = True
+        started = time.monotonic()
+        self._start_db_task(
+            lambda faculty_list: self._apply_loaded_rows(faculty_list, key, started),
+            "Error", "Failed to load faculty data",
+            self.db_manager.search_faculty, dept or None, status or None, None, FACULTY_PAGE_SIZE,
+            on_failed=self._finish_load
+        )
+        
+    def _load_next_page(self):
+        """Load the next page of the shown faculty list in the background."""
+        if self._load_in_flight or self._cache_key is None:
+            # The list is being replaced; its reset allows fetching again
+            return
+            
+        _, dept, status = self._cache_key
+        generation = self._list_generation
+        offset = self._page_offset
+        self._start_db_task(
+            lambda faculty_list: self._apply_page(faculty_list, generation, offset),
+            "Error", "Failed to load faculty data",
+            self.db_manager.search_faculty, dept or None, status or None, None,
+            FACULTY_PAGE_SIZE, offset,
+            on_failed=self.faculty_model.cancel_fetch
+        )
+        
+    def _apply_page(self, faculty_list, generation, offset):
+        """
+        Append a page of faculty data loaded by _load_next_page.
+        
+        Args:
+            faculty_list (list): Faculty data dicts
+            generation (int): List generation the page was loaded for
+            offset (int): Database offset the page was loaded from
+        """
+        if generation != self._list_generation or offset != self._page_offset:
+            # The list was replaced or a row was deleted meanwhile
+            self.faculty_model.cancel_fetch()
+            return
+            
+        # A faculty member added through this panel is already shown and
+        # may also come back in a later page
+        shown = {faculty.get('id') for faculty in self.faculty_model.all_rows()}
+        new_rows = [faculty for faculty in faculty_list if faculty.get('id') not in shown]
+        
+        self._page_offset += len(faculty_list)
+        self.faculty_model.append_rows(new_rows, len(faculty_list) >= FACULTY_PAGE_SIZE)
+        self.logger.info(f"Loaded {len(new_rows)} more faculty members")
+        
+        self._sync_dept_filter(self.faculty_model.all_rows())
+        
+    def _query_filters(self):
+        """
+        Get the department and status filters applied by the database query.
+        
+        Returns:
+            tuple: (department, lowercase status), each empty for all
+        """
+        department = self.dept_filter.currentText()
+        status = self.status_filter.currentText().lower()
+        return ("" if department in ("All Departments", "") else department,
+                "" if status == "all statuses" else status)
+        
+    def _on_query_filter_changed(self):
+        """Apply a changed department or status filter, reloading the matching faculty."""
+        self.apply_filters()
+        self.refresh_data()
+        
+    def _start_db_task(self, on_finished, error_title, error_message, func, *args, on_failed=None):
+        """
+        Run a database call on the global thread pool.
+        
+        Args:
+            on_finished (callable): Called on the GUI thread with the call's return value
+            error_title (str): Title of the error dialog shown if the call raises
+            error_message (str): Message of that error dialog
+            func (callable): Function to call
+            *args: Arguments for the function
+            on_failed (callable, optional): Called on the GUI thread before the error dialog if the call raises
+        """
+        task = _DbTask(func, *args)
+        self._tasks.add(task)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(
+            lambda details: self._on_db_task_failed(error_title, error_message, details, on_failed)
+        )
+        task.signals.finished.connect(lambda _: self._tasks.discard(task))
+        task.signals.failed.connect(lambda _: self._tasks.discard(task))
+        QThreadPool.globalInstance().start(task)
         
-        # Clear table
-        self.faculty_table.setRowCount(0)
+    def _on_db_task_failed(self, error_title, error_message, details, on_failed=None):
+        """
+        Report a database call that raised.
         
-        # Get all faculty
+        Args:
+            error_title (str): Error dialog title
+            error_message (str): Error dialog message
+            details (str): Error details
+            on_failed (callable, optional): Called before the error dialog is shown
+        """
+        self.logger.error(f"{error_message}: {details}")
+        if on_failed:
+            on_failed()
+        show_error_dialog(title=error_title, message=error_message, details=details)
+        
+    def _finish_load(self):
+        """Clear the in-flight load and run a refresh requested meanwhile."""
+        self._load_in_flight = False
+        if self._reload_requested:
+            self._reload_requested = False
+            self.refresh_data()
+            
+    def _apply_loaded_rows(self, faculty_list, key, started):
+        """
+        Show faculty data loaded by refresh_data.
+        
+        Args:
+            faculty_list (list): Faculty data dicts
+            key (tuple): (change token, department, status) the query ran with
+            started (float): time.monotonic() when the query was started
+        """
         try:
-            faculty_list = self.db_manager.get_all_faculty()
+            self._cache_key = key
+            self._cache_ts = started
+            self._list_generation += 1
+            self._page_offset = len(faculty_list)
+            more = len(faculty_list) >= FACULTY_PAGE_SIZE
             
             if not faculty_list:
                 self.logger.warning("No faculty found")
+                self.faculty_model.set_rows([])
                 return
                 
             self.logger.info(f"Loaded {len(faculty_list)} faculty members")
             
-            # Get unique departments for filter
-            departments = set()
-            for faculty in faculty_list:
-                if 'department' in faculty and faculty['department']:
-                    departments.add(faculty['department'])
-            
-            # Update department filter
-            current_dept = self.dept_filter.currentText()
-            self.dept_filter.clear()
-            self.dept_filter.addItem("All Departments")
-            for dept in sorted(departments):
-                self.dept_filter.addItem(dept)
-            
-            # Restore selection if possible
-            index = self.dept_filter.findText(current_dept)
-            if index >= 0:
-                self.dept_filter.setCurrentIndex(index)
-            
-            # Populate table
-            self.faculty_table.setRowCount(len(faculty_list))
-            for row, faculty in enumerate(faculty_list):
-                # ID
-                id_item = QTableWidgetItem(faculty.get('id', ''))
-                id_item.setData(Qt.ItemDataRole.UserRole, faculty)  # Store faculty data
-                self.faculty_table.setItem(row, 0, id_item)
-                
-                # Name
-                name_item = QTableWidgetItem(faculty.get('name', ''))
-                self.faculty_table.setItem(row, 1, name_item)
-                
-                # Department
-                dept_item = QTableWidgetItem(faculty.get('department', ''))
-                self.faculty_table.setItem(row, 2, dept_item)
-                
-                # Email
-                email_item = QTableWidgetItem(faculty.get('email', ''))
-                self.faculty_table.setItem(row, 3, email_item)
-                
-                # Office
-                office_item = QTableWidgetItem(faculty.get('office', ''))
-                self.faculty_table.setItem(row, 4, office_item)
-                
-                # BLE ID
-                ble_item = QTableWidgetItem(faculty.get('ble_beacon_id', ''))
-                self.faculty_table.setItem(row, 5, ble_item)
-                
-                # Status
-                status_item = QTableWidgetItem(faculty.get('status', 'unavailable').capitalize())
-                
-                # Set color based on status
-                if faculty.get('status') == 'available':
-                    status_item.setForeground(QColor('#4ECDC4'))  # Green (from theme)
-                else:
-                    status_item.setForeground(QColor('#FF6B6B'))  # Red (from theme)
-                    
-                self.faculty_table.setItem(row, 6, status_item)
+            # Update department filter only if the departments changed
+            self._sync_dept_filter(faculty_list)
+            
+            # Populate table and apply filters, repainting once at the end;
+            # selection changes from the reset are handled once afterwards
+            self.faculty_table.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(self.faculty_table.selectionModel()):
+                    self.faculty_model.set_rows(faculty_list, more)
+                    self.apply_filters()
+            finally:
+                self.faculty_table.setUpdatesEnabled(True)
+            self.handle_faculty_selection()
             
-            # Apply filters
-            self.apply_filters()
+            if not self._columns_sized:
+                self.faculty_table.resizeColumnsToContents()
+                self._columns_sized = True
             
         except Exception as e:
             self.logger.error(f"Error refreshing faculty data: {e}")
             QMessageBox.critical(self, "Error", f"Failed to load faculty data: {e}")
+        finally:
+            self._finish_load()
             
+    def _sync_dept_filter(self, faculty_list):
+        """
+        Make the department filter list the departments of the given faculty.
+        
+        Only an unfiltered list has every department, so filtered lists
+        leave the department filter unchanged.
+        
+        Args:
+            faculty_list (list): Faculty data dicts
+        """
+        if self._cache_key is None or self._cache_key[1] or self._cache_key[2]:
+            return
+            
+        departments = frozenset(
+            faculty['department'] for faculty in faculty_list if faculty.get('department')
+        )
+        if departments != self._last_depts:
+            self._update_dept_filter(departments)
+            
+    def _note_own_write(self):
+        """
+        Keep the shown list current after applying this panel's own write to it.
+        
+        If the write was the only one since the list was loaded, the list
+        stays valid for the new change token; otherwise the next refresh
+        reloads it.
+        """
+        token = self.db_manager.faculty_change_token()
+        if self._cache_key and token == self._cache_key[0] + 1:
+            self._cache_key = (token,) + self._cache_key[1:]
+            
+    def _update_dept_filter(self, departments):
+        """
+        Change the department filter's items to the given departments.
+        
+        Only departments that were added or removed are touched, keeping the
+        items sorted. The filter's signals are blocked meanwhile, so no
+        filter pass runs per change; the caller re-applies the filters once.
+        
+        Args:
+            departments (frozenset): Departments to list
+        """
+        current_dept = self.dept_filter.currentText()
+        
+        with QSignalBlocker(self.dept_filter):
+            # Remove departed departments, keeping "All Departments" at index 0
+            for index in range(self.dept_filter.count() - 1, 0, -1):
+                if self.dept_filter.itemText(index) not in departments:
+                    self.dept_filter.removeItem(index)
+                    
+            # Insert new departments at their sorted positions
+            listed = [self.dept_filter.itemText(index) for index in range(1, self.dept_filter.count())]
+            for dept in sorted(departments - self._last_depts):
+                position = bisect.bisect(listed, dept)
+                listed.insert(position, dept)
+                self.dept_filter.insertItem(position + 1, dept)
+                
+            # Restore selection if possible; the listed names are sorted,
+            # so a binary search finds it ("All Departments" is index 0)
+            position = bisect.bisect_left(listed, current_dept)
+            found = position < len(listed) and listed[position] == current_dept
+            self.dept_filter.setCurrentIndex(position + 1 if found else 0)
+            
+        self._last_depts = departments
+        
     def apply_filters(self):
         """Apply filters to the faculty table."""
         self.logger.info("Applying faculty filters")
         
-        # Get filter values
-        department = self.dept_filter.currentText()
-        status = self.status_filter.currentText().lower()
-        search_text = self.search_input.text().lower()
-        
-        # Show all rows first
-        for row in range(self.faculty_table.rowCount()):
-            self.faculty_table.setRowHidden(row, False)
-            
-        # Apply filters
-        for row in range(self.faculty_table.rowCount()):
-            # Get row data
-            dept_item = self.faculty_table.item(row, 2)
-            status_item = self.faculty_table.item(row, 6)
-            name_item = self.faculty_table.item(row, 1)
-            email_item = self.faculty_table.item(row, 3)
-            
-            dept_text = dept_item.text() if dept_item else ""
-            status_text = status_item.text().lower() if status_item else ""
-            name_text = name_item.text().lower() if name_item else ""
-            email_text = email_item.text().lower() if email_item else ""
-            
-            # Check if row matches all filters
-            dept_match = department == "All Departments" or dept_text == department
-            status_match = status == "all statuses" or status_text == status
-            search_match = (
-                not search_text or 
-                search_text in name_text or 
-                search_text in email_text
-            )
-            
-            # Hide row if it doesn't match any filter
-            if not (dept_match and status_match and search_match):
-                self.faculty_table.setRowHidden(row, True)
-                
+        self._search_timer.stop()
+        
+        # Get filter values; "All ..." choices and empty search match everything.
+        # The proxy applies all three, keeping rows added or edited in place
+        # consistent with the department and status the list was loaded for
+        department, status = self._query_filters()
+        self.faculty_proxy.set_filters(department, status, self.search_input.text().lower())
+        
     def handle_faculty_selection(self):
         """Handle faculty selection in the table."""
         # Enable/disable buttons based on selection
-        has_selection = len(self.faculty_table.selectedItems()) > 0
+        has_selection = self.faculty_table.selectionModel().hasSelection()
         self.edit_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
         self.view_history_button.setEnabled(has_selection)
         
+        # Viewing the history is the likely next step; fetch it now
+        if has_selection:
+            self._prefetch_history(self.get_selected_faculty())
+            
+    def _prefetch_history(self, faculty):
+        """
+        Fetch a faculty member's status history in the background.
+        
+        The result is kept on the faculty data as '_history_cache' so the
+        history viewer opens without a query. It is dropped by any faculty
+        write made while it was being fetched, and by reloading the list.
+        
+        Args:
+            faculty (dict): Faculty data
+        """
+        faculty_id = faculty.get('id') if faculty else None
+        if not faculty_id or '_history_cache' in faculty or faculty_id in self._history_prefetching:
+            return
+            
+        self._history_prefetching.add(faculty_id)
+        token = self.db_manager.faculty_change_token()
+        
+        # Import here to avoid circular imports
+        from ui.admin_panels.faculty_history_viewer import HISTORY_LIMIT
+        
+        # Failures are not reported; the viewer queries the history itself.
+        # One entry past the viewer's limit tells it whether any were left out
+        task = _DbTask(self.db_manager.get_faculty_history, faculty_id, None, None, None, 0, HISTORY_LIMIT + 1)
+        self._tasks.add(task)
+        task.signals.finished.connect(lambda history: self._on_history_prefetched(faculty, token, history))
+        task.signals.failed.connect(lambda _: self._history_prefetching.discard(faculty_id))
+        task.signals.finished.connect(lambda _: self._tasks.discard(task))
+        task.signals.failed.connect(lambda _: self._tasks.discard(task))
+        QThreadPool.globalInstance().start(task)
+        
+    def _on_history_prefetched(self, faculty, token, history):
+        """
+        Keep a prefetched status history on its faculty data.
+        
+        Args:
+            faculty (dict): Faculty data
+            token (int): Faculty change token when the fetch started
+            history (list): Status history entries, newest first
+        """
+        self._history_prefetching.discard(faculty.get('id'))
+        
+        # The database manager returns [] on errors; don't let that hide the
+        # history loaded with the faculty list
+        if not history and faculty.get('status_history'):
+            return
+        if token == self.db_manager.faculty_change_token():
+            faculty['_history_cache'] = history
+        
     def get_selected_faculty(self):
         """
         Get the currently selected faculty member.
@@ -529,64 +1095,64 @@ class FacultyManagerPanel(QWidget):
         Returns:
             dict: Faculty data, or None if no faculty is selected
         """
-        selected_items = self.faculty_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.faculty_table.selectionModel().selectedRows()
+        if not selected_rows:
             return None
             
-        # Get the row of the first selected item
-        row = selected_items[0].row()
-        
-        # Get the faculty data stored in the ID item
-        id_item = self.faculty_table.item(row, 0)
-        if not id_item:
-            return None
-            
-        return id_item.data(Qt.ItemDataRole.UserRole)
+        # The source model row holds the faculty data itself
+        source_index = self.faculty_proxy.mapToSource(selected_rows[0])
+        return self.faculty_model.faculty_at(source_index.row())
         
     def add_faculty(self):
         """Add a new faculty member."""
         self.logger.info("Adding new faculty member")
         
-        dialog = FacultyDialog(self.db_manager, parent=self)
+        dialog = FacultyDialog(parent=self)
         
         if dialog.exec():
             # Get faculty data
             faculty_data = dialog.get_faculty_data()
             
-            try:
-                # Add to database
-                faculty_id = self.db_manager.add_faculty(faculty_data)
-                
-                if not faculty_id:
-                    show_error_dialog(
-                        title="Add Faculty", 
-                        message="Failed to add faculty",
-                        details="The operation was unsuccessful. Please try again."
-                    )
-                    return
-                    
-                self.logger.info(f"Faculty added: {faculty_id}")
-                
-                # Add audit log
-                self.db_manager.add_audit_log({
-                    'action': 'add_faculty',
-                    'user_id': 'admin',  # Should be replaced with actual admin ID
-                    'details': f"Added new faculty member: {faculty_data.get('name')}"
-                })
-                
-                # Refresh faculty data
-                self.refresh_data()
-                
-                # Show success message
-                QMessageBox.information(self, "Add Faculty", "Faculty added successfully.")
-                
-            except Exception as e:
-                self.logger.error(f"Error adding faculty: {e}")
-                show_error_dialog(
-                    title="Add Faculty", 
-                    message="Error adding faculty",
-                    details=str(e)
-                )
+            # Write in the background; the result is handled on the GUI thread
+            self._start_db_task(
+                lambda faculty_id: self._on_faculty_added(faculty_data, faculty_id),
+                "Add Faculty", "Error adding faculty",
+                self.db_manager.add_faculty, faculty_data
+            )
+            
+    def _on_faculty_added(self, faculty_data, faculty_id):
+        """
+        Report the result of adding a faculty member.
+        
+        Args:
+            faculty_data (dict): Faculty data
+            faculty_id (str): Faculty ID, or None if adding failed
+        """
+        if not faculty_id:
+            show_error_dialog(
+                title="Add Faculty", 
+                message="Failed to add faculty",
+                details="The operation was unsuccessful. Please try again."
+            )
+            return
+            
+        self.logger.info(f"Faculty added: {faculty_id}")
+        
+        # Queue audit log
+        self.audit_batcher.enqueue({
+            'action': 'add_faculty',
+            'user_id': 'admin',  # Should be replaced with actual admin ID
+            'details': f"Added new faculty member: {faculty_data.get('name')}"
+        })
+        
+        # Show the new row without reloading the list
+        faculty_data['id'] = faculty_id
+        self.faculty_model.append_row(faculty_data)
+        self._sync_dept_filter(self.faculty_model.all_rows())
+        self._note_own_write()
+        
+        # Show success message
+        QMessageBox.information(self, "Add Faculty", "Faculty added successfully.")
                 
     def edit_faculty(self):
         """Edit the selected faculty member."""
@@ -597,52 +1163,85 @@ class FacultyManagerPanel(QWidget):
             self.logger.warning("No faculty selected for editing")
             return
             
-        dialog = FacultyDialog(self.db_manager, faculty=faculty, parent=self)
+        dialog = FacultyDialog(faculty=faculty, parent=self)
         
         if dialog.exec():
             # Get updated faculty data
             faculty_data = dialog.get_faculty_data()
             
-            try:
-                # Update in database
-                success = self.db_manager.update_faculty(faculty.get('id'), faculty_data)
-                
-                if not success:
-                    show_error_dialog(
-                        title="Edit Faculty", 
-                        message="Failed to update faculty",
-                        details="The operation was unsuccessful. Please try again."
-                    )
-                    return
-                    
-                self.logger.info(f"Faculty updated: {faculty.get('id')}")
-                
-                # Add audit log
-                self.db_manager.add_audit_log({
-                    'action': 'edit_faculty',
-                    'user_id': 'admin',  # Should be replaced with actual admin ID
-                    'details': f"Updated faculty member: {faculty_data.get('name')} ({faculty.get('id')})"
-                })
-                
-                # Refresh faculty data
-                self.refresh_data()
-                
-                # Show success message
-                QMessageBox.information(self, "Edit Faculty", "Faculty updated successfully.")
-                
-                # Publish status update if changed
-                if faculty.get('status') != faculty_data.get('status'):
+            # Write in the background; the result is handled on the GUI thread
+            self._start_db_task(
+                lambda success: self._on_faculty_updated(faculty, faculty_data, success),
+                "Edit Faculty", "Error updating faculty",
+                self._update_faculty_record, faculty, faculty_data
+            )
+            
+    def _update_faculty_record(self, faculty, faculty_data):
+        """
+        Update a faculty member and publish a changed status. Runs on the thread pool.
+        
+        Args:
+            faculty (dict): Faculty data before the update
+            faculty_data (dict): Updated faculty data
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        # Update in database
+        success = self.db_manager.update_faculty(faculty.get('id'), faculty_data)
+        
+        if success:
+            # Publish status update if changed, as soon as the write is done;
+            # a failed publish must not turn a successful update into an error
+            if faculty.get('status') != faculty_data.get('status'):
+                try:
                     self.mqtt_client.publish_faculty_status(
                         faculty.get('id'), faculty_data.get('status')
                     )
-                
-            except Exception as e:
-                self.logger.error(f"Error updating faculty: {e}")
-                show_error_dialog(
-                    title="Edit Faculty", 
-                    message="Error updating faculty",
-                    details=str(e)
-                )
+                except Exception as e:
+                    self.logger.error(f"Error publishing faculty status: {e}")
+                    
+        return success
+        
+    def _on_faculty_updated(self, faculty, faculty_data, success):
+        """
+        Report the result of updating a faculty member.
+        
+        Args:
+            faculty (dict): Faculty data before the update
+            faculty_data (dict): Updated faculty data
+            success (bool): Whether the update succeeded
+        """
+        if not success:
+            show_error_dialog(
+                title="Edit Faculty", 
+                message="Failed to update faculty",
+                details="The operation was unsuccessful. Please try again."
+            )
+            return
+            
+        self.logger.info(f"Faculty updated: {faculty.get('id')}")
+        
+        # Queue audit log
+        self.audit_batcher.enqueue({
+            'action': 'edit_faculty',
+            'user_id': 'admin',  # Should be replaced with actual admin ID
+            'details': f"Updated faculty member: {faculty_data.get('name')} ({faculty.get('id')})"
+        })
+        
+        # Update the row in place without reloading the list
+        row = self.faculty_model.row_of(faculty)
+        if row >= 0:
+            faculty.pop('_history_cache', None)
+            faculty.update(faculty_data)
+            self.faculty_model.row_changed(row)
+            self._sync_dept_filter(self.faculty_model.all_rows())
+            self._note_own_write()
+        else:
+            self.refresh_data()
+        
+        # Show success message
+        QMessageBox.information(self, "Edit Faculty", "Faculty updated successfully.")
                 
     def delete_faculty(self):
         """Delete the selected faculty member."""
@@ -665,40 +1264,51 @@ class FacultyManagerPanel(QWidget):
         if result != QMessageBox.StandardButton.Yes:
             return
             
-        try:
-            # Delete from database
-            success = self.db_manager.delete_faculty(faculty.get('id'))
-            
-            if not success:
-                show_error_dialog(
-                    title="Delete Faculty", 
-                    message="Failed to delete faculty",
-                    details="The operation was unsuccessful. Please try again."
-                )
-                return
-                
-            self.logger.info(f"Faculty deleted: {faculty.get('id')}")
-            
-            # Add audit log
-            self.db_manager.add_audit_log({
-                'action': 'delete_faculty',
-                'user_id': 'admin',  # Should be replaced with actual admin ID
-                'details': f"Deleted faculty member: {faculty.get('name')} ({faculty.get('id')})"
-            })
-            
-            # Refresh faculty data
-            self.refresh_data()
-            
-            # Show success message
-            QMessageBox.information(self, "Delete Faculty", "Faculty deleted successfully.")
-            
-        except Exception as e:
-            self.logger.error(f"Error deleting faculty: {e}")
+        # Delete in the background; the result is handled on the GUI thread
+        self._start_db_task(
+            lambda success: self._on_faculty_deleted(faculty, success),
+            "Delete Faculty", "Error deleting faculty",
+            self.db_manager.delete_faculty, faculty.get('id')
+        )
+        
+    def _on_faculty_deleted(self, faculty, success):
+        """
+        Report the result of deleting a faculty member.
+        
+        Args:
+            faculty (dict): Faculty data
+            success (bool): Whether the deletion succeeded
+        """
+        if not success:
             show_error_dialog(
                 title="Delete Faculty", 
-                message="Error deleting faculty",
-                details=str(e)
+                message="Failed to delete faculty",
+                details="The operation was unsuccessful. Please try again."
             )
+            return
+            
+        self.logger.info(f"Faculty deleted: {faculty.get('id')}")
+        
+        # Queue audit log
+        self.audit_batcher.enqueue({
+            'action': 'delete_faculty',
+            'user_id': 'admin',  # Should be replaced with actual admin ID
+            'details': f"Deleted faculty member: {faculty.get('name')} ({faculty.get('id')})"
+        })
+        
+        # Remove the row without reloading the list
+        row = self.faculty_model.row_of(faculty)
+        if row >= 0:
+            self.faculty_model.remove_row(row)
+            # Later database rows moved up by one
+            self._page_offset = max(0, self._page_offset - 1)
+            self._sync_dept_filter(self.faculty_model.all_rows())
+            self._note_own_write()
+        else:
+            self.refresh_data()
+        
+        # Show success message
+        QMessageBox.information(self, "Delete Faculty", "Faculty deleted successfully.")
             
     def view_faculty_history(self):
         """View the selected faculty member's status history."""
@@ -712,5 +1322,7 @@ class FacultyManagerPanel(QWidget):
         # Import here to avoid circular imports
         from ui.admin_panels.faculty_history_viewer import FacultyHistoryViewer
         
-        dialog = FacultyHistoryViewer(faculty, parent=self)
+        dialog = FacultyHistoryViewer(
+            faculty, self.db_manager, history=faculty.get('_history_cache'), parent=self
+        )
         dialog.exec() 
\ No newline at end of file
@@ -7,19 +7,31 @@ This module provides a panel for managing office information in the admin interf
 """
 
 import os
+import time
 from datetime import datetime
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QFrame, QLineEdit, QComboBox, 
-                            QFormLayout, QTableWidget, QTableWidgetItem,
-                            QHeaderView, QDialog, QMessageBox, QSpacerItem,
-                            QSizePolicy, QCheckBox, QGroupBox, QDialogButtonBox,
-                            QSpinBox)
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor
+                            QFormLayout, QTableView, QHeaderView, QDialog,
+                            QMessageBox, QSpacerItem, QSizePolicy, QCheckBox,
+                            QGroupBox, QDialogButtonBox, QSpinBox)
+from PyQt6.QtCore import (Qt, QSize, QTimer, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel, QRegularExpression, QSignalBlocker)
+from PyQt6.QtGui import QFont, QColor, QBrush
 
 from utils.logger import get_logger
 from utils.error_handler import show_error_dialog, show_warning_dialog, show_confirmation_dialog
 
+# Status text colors, built once at import and shared by every row:
+# green (#28a745) for active, amber (#ffc107) for maintenance, red (#dc3545) otherwise
+_STATUS_BRUSH = {
+    'Active': QBrush(QColor(40, 167, 69)),
+    'Maintenance': QBrush(QColor(255, 193, 7)),
+}
+_DEFAULT_STATUS_BRUSH = QBrush(QColor(220, 53, 69))
+
+# Seconds the loaded office list is reused before refresh_data queries again
+OFFICE_CACHE_TTL = 30
+
 class OfficeDialog(QDialog):
     """
     Dialog for adding or editing office information.
@@ -126,6 +138,8 @@ class OfficeDialog(QDialog):
         """
         Get office data from the form.
         
+        The panel stamps 'last_updated' when it writes the data.
+        
         Returns:
             dict: Office data
         """
@@ -136,8 +150,7 @@ class OfficeDialog(QDialog):
             'floor': self.floor_spin.value(),
             'room': self.room_input.text().strip(),
             'ble_beacon_id': self.beacon_input.text().strip(),
-            'status': self.status_combo.currentText(),
-            'last_updated': datetime.now().isoformat()
+            'status': self.status_combo.currentText()
         }
         
         return office_data
@@ -183,23 +196,175 @@ class OfficeDialog(QDialog):
         if self.validate():
             super().accept()
 
+class OfficeTableModel(QAbstractTableModel):
+    """
+    Table model serving office rows to a QTableView on demand.
+    
+    The office dicts from the database are the model's storage; cell text
+    is looked up only when the view asks for it. Column 0 also returns the
+    office dict itself for Qt.ItemDataRole.UserRole.
+    """
+    
+    HEADERS = ("Office ID", "Name", "Building", "Floor", "Room", "Beacon ID", "Status")
+    KEYS = ('office_id', 'name', 'building', 'floor', 'room', 'ble_beacon_id', 'status')
+    BUILDING_COLUMN = 2
+    STATUS_COLUMN = 6
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the model.
+        
+        Args:
+            parent (QObject, optional): Parent object
+        """
+        super().__init__(parent)
+        self._rows = []
+        
+        # Display text per row, built once so data() is a tuple lookup
+        self._rows_display = []
+        
+    @classmethod
+    def _display(cls, office):
+        """
+        Get the display text of every column of an office row.
+        
+        Args:
+            office (dict): Office data
+            
+        Returns:
+            tuple: Cell text in column order
+        """
+        get = office.get
+        cells = [str(get(key, '')) for key in cls.KEYS]
+        cells[cls.STATUS_COLUMN] = get('status', 'Active')
+        return tuple(cells)
+        
+    def set_rows(self, rows):
+        """
+        Replace all rows.
+        
+        Args:
+            rows (list): Office data dicts
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._rows_display = [self._display(office) for office in rows]
+        self.endResetModel()
+        
+    def office_at(self, row):
+        """
+        Get the office data shown in a row.
+        
+        Args:
+            row (int): Row number
+            
+        Returns:
+            dict: Office data
+        """
+        return self._rows[row]
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows_display[row][column]
+        if role == Qt.ItemDataRole.ForegroundRole and column == self.STATUS_COLUMN:
+            return _STATUS_BRUSH.get(self._rows_display[row][column], _DEFAULT_STATUS_BRUSH)
+        if role == Qt.ItemDataRole.UserRole and column == 0:
+            return self._rows[row]
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+class OfficeFilterProxy(QSortFilterProxyModel):
+    """
+    Proxy model hiding office rows that do not match the panel's filters.
+    
+    Building and status are matched on the source model's office dicts.
+    The search text is the proxy's own fixed-string filter, matched
+    case-insensitively against every column by Qt.
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the proxy.
+        
+        Args:
+            parent (QObject, optional): Parent object
+        """
+        super().__init__(parent)
+        self.building = ""
+        self.status = ""
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setFilterKeyColumn(-1)
+        
+    def set_filters(self, building, status, search):
+        """
+        Set the filter values and re-filter the rows once.
+        
+        Args:
+            building (str): Building to show, empty for all
+            status (str): Status to show, empty for all
+            search (str): Text to find in any column, empty for all
+        """
+        self.building = building
+        self.status = status
+        
+        # Setting a changed search text re-filters by itself
+        if QRegularExpression.escape(search) != self.filterRegularExpression().pattern():
+            self.setFilterFixedString(search)
+        else:
+            self.invalidateFilter()
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        office = model.office_at(source_row)
+        if self.building and office.get('building', '') != self.building:
+            return False
+        if self.status and office.get('status', 'Active') != self.status:
+            return False
+        return super().filterAcceptsRow(source_row, source_parent)
+        
 class OfficeManagerPanel(QWidget):
     """
     Office manager panel for the admin interface.
     Allows administrators to add, edit, and delete office information.
     """
     
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, audit_batcher):
         """
         Initialize the office manager panel.
         
         Args:
             db_manager: Database manager instance
+            audit_batcher (AuditLogBatcher): Batcher audit log entries are queued on
         """
         super().__init__()
         self.logger = get_logger(__name__)
         self.db_manager = db_manager
         
+        # Audit log entries are written in batches, not one round-trip per action
+        self.audit_batcher = audit_batcher
+        
+        # Office list last loaded, kept current by this panel's own writes,
+        # and when it was loaded (time.monotonic())
+        self._office_cache = None
+        self._office_cache_ts = 0.0
+        
+        # Buildings currently listed in the building filter, sorted
+        self._last_buildings = []
+        
         self.init_ui()
         self.refresh_data()
         
@@ -246,11 +411,18 @@ class OfficeManagerPanel(QWidget):
         filter_label = QLabel("Filter:")
         controls_layout.addWidget(filter_label)
         
+        # Filter changes and keystrokes in the search box are coalesced
+        # into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        
         # Building filter
         self.building_filter = QComboBox()
         self.building_filter.setObjectName("admin-combo")
         self.building_filter.addItem("All Buildings")
-        self.building_filter.currentTextChanged.connect(self.apply_filters)
+        self.building_filter.currentTextChanged.connect(self._filter_timer.start)
         controls_layout.addWidget(self.building_filter)
         
         # Status filter
@@ -258,112 +430,59 @@ class OfficeManagerPanel(QWidget):
         self.status_filter.setObjectName("admin-combo")
         self.status_filter.addItem("All Statuses")
         self.status_filter.addItems(["Active", "Inactive", "Maintenance"])
-        self.status_filter.currentTextChanged.connect(self.apply_filters)
+        self.status_filter.currentTextChanged.connect(self._filter_timer.start)
         controls_layout.addWidget(self.status_filter)
         
         # Search
         self.search_input = QLineEdit()
         self.search_input.setObjectName("search-input")
         self.search_input.setPlaceholderText("Search offices...")
-        self.search_input.textChanged.connect(self.apply_filters)
+        self.search_input.textChanged.connect(self._filter_timer.start)
         controls_layout.addWidget(self.search_input)
         
         main_layout.addLayout(controls_layout)
         
-        # Office table
-        self.office_table = QTableWidget()
+        # Office table; the model holds the office data and the proxy filters it
+        self.office_model = OfficeTableModel(self)
+        self.office_proxy = OfficeFilterProxy(self)
+        self.office_proxy.setSourceModel(self.office_model)
+        self.office_table = QTableView()
+        self.office_table.setModel(self.office_proxy)
         self.office_table.setObjectName("admin-table")
-        self.office_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.office_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.office_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.office_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.office_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.office_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.office_table.setAlternatingRowColors(True)
-        self.office_table.setColumnCount(7)
-        self.office_table.setHorizontalHeaderLabels([
-            "Office ID", "Name", "Building", "Floor", "Room", "Beacon ID", "Status"
-        ])
         self.office_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.office_table.verticalHeader().setVisible(False)
-        self.office_table.itemSelectionChanged.connect(self.handle_office_selection)
+        self.office_table.selectionModel().selectionChanged.connect(self.handle_office_selection)
         main_layout.addWidget(self.office_table)
         
-    def refresh_data(self):
-        """Refresh office data from the database."""
-        self.logger.info("Refreshing office data")
+    def refresh_data(self, force=False):
+        """
+        Refresh office data from the database.
         
-        # Clear table
-        self.office_table.setRowCount(0)
+        The office list loaded less than OFFICE_CACHE_TTL seconds ago is
+        reused instead of querying, unless forced.
+        
+        Args:
+            force (bool, optional): Query even if the loaded list is recent
+        """
+        self.logger.info("Refreshing office data")
         
         # Get all offices
         try:
-            office_list = self.db_manager.get_all_offices()
-            
-            if not office_list:
-                self.logger.warning("No offices found")
+            if (not force and self._office_cache is not None
+                    and time.monotonic() - self._office_cache_ts < OFFICE_CACHE_TTL):
+                # The shown list is the cached one; nothing to redraw
+                self.logger.info("Office data recent, keeping the loaded list")
                 return
                 
-            self.logger.info(f"Loaded {len(office_list)} offices")
+            office_list = self.db_manager.get_all_offices() or []
+            self._office_cache = office_list
+            self._office_cache_ts = time.monotonic()
             
-            # Get unique buildings for filter
-            buildings = set()
-            for office in office_list:
-                if 'building' in office and office['building']:
-                    buildings.add(office['building'])
-            
-            # Update building filter
-            current_building = self.building_filter.currentText()
-            self.building_filter.clear()
-            self.building_filter.addItem("All Buildings")
-            for building in sorted(buildings):
-                self.building_filter.addItem(building)
-            
-            # Restore selection if possible
-            index = self.building_filter.findText(current_building)
-            if index >= 0:
-                self.building_filter.setCurrentIndex(index)
-            
-            # Populate table
-            self.office_table.setRowCount(len(office_list))
-            for row, office in enumerate(office_list):
-                # Office ID
-                id_item = QTableWidgetItem(office.get('office_id', ''))
-                id_item.setData(Qt.ItemDataRole.UserRole, office)  # Store office data
-                self.office_table.setItem(row, 0, id_item)
-                
-                # Name
-                name_item = QTableWidgetItem(office.get('name', ''))
-                self.office_table.setItem(row, 1, name_item)
-                
-                # Building
-                building_item = QTableWidgetItem(office.get('building', ''))
-                self.office_table.setItem(row, 2, building_item)
-                
-                # Floor
-                floor_item = QTableWidgetItem(str(office.get('floor', '')))
-                self.office_table.setItem(row, 3, floor_item)
-                
-                # Room
-                room_item = QTableWidgetItem(office.get('room', ''))
-                self.office_table.setItem(row, 4, room_item)
-                
-                # Beacon ID
-                beacon_item = QTableWidgetItem(office.get('ble_beacon_id', ''))
-                self.office_table.setItem(row, 5, beacon_item)
-                
-                # Status
-                status_item = QTableWidgetItem(office.get('status', 'Active'))
-                self.office_table.setItem(row, 6, status_item)
-                
-                # Set status color
-                status = office.get('status', 'Active')
-                if status == 'Active':
-                    status_item.setForeground(QColor("#28a745"))
-                elif status == 'Maintenance':
-                    status_item.setForeground(QColor("#ffc107"))
-                else:
-                    status_item.setForeground(QColor("#dc3545"))
-            
-            # Apply filters
-            self.apply_filters()
+            self._show_offices(office_list)
             
         except Exception as e:
             self.logger.error(f"Error refreshing office data: {e}")
@@ -373,55 +492,114 @@ class OfficeManagerPanel(QWidget):
                 details=str(e)
             )
             
-    def apply_filters(self):
-        """Apply filters to the office table."""
-        search_text = self.search_input.text().lower()
-        building = self.building_filter.currentText()
-        status = self.status_filter.currentText()
+    def _show_offices(self, office_list):
+        """
+        Show an office list in the table and building filter.
         
-        for row in range(self.office_table.rowCount()):
-            # Get office data
-            office_item = self.office_table.item(row, 0)
-            if not office_item:
-                continue
-                
-            show_row = True
-            
-            # Building filter
-            if building != "All Buildings":
-                building_item = self.office_table.item(row, 2)
-                if not building_item or building_item.text() != building:
-                    show_row = False
+        Args:
+            office_list (list): Office data dicts
+        """
+        if not office_list:
+            self.logger.warning("No offices found")
+            self.office_model.set_rows([])
+            self.handle_office_selection()
+            return
             
-            # Status filter
-            if status != "All Statuses" and show_row:
-                status_item = self.office_table.item(row, 6)
-                if not status_item or status_item.text() != status:
-                    show_row = False
+        self.logger.info(f"Showing {len(office_list)} offices")
+        
+        # Update the building filter only if the buildings changed
+        buildings = sorted({office['building'] for office in office_list if office.get('building')})
+        # Signals are blocked meanwhile; the filters are applied once below
+        if buildings != self._last_buildings:
+            current_building = self.building_filter.currentText()
+            with QSignalBlocker(self.building_filter):
+                self.building_filter.clear()
+                self.building_filter.addItem("All Buildings")
+                self.building_filter.addItems(buildings)
+                
+                # Restore selection if possible
+                index = self.building_filter.findText(current_building)
+                if index >= 0:
+                    self.building_filter.setCurrentIndex(index)
                     
-            # Search text
-            if search_text and show_row:
-                text_match = False
-                for col in range(7):
-                    item = self.office_table.item(row, col)
-                    if item and search_text in item.text().lower():
-                        text_match = True
-                        break
+            self._last_buildings = buildings
+        
+        # Populate table and apply filters, repainting once at the end;
+        # selection changes from the reset are handled once afterwards
+        self.office_table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.office_table.selectionModel()):
+                self.office_model.set_rows(office_list)
+                self.apply_filters()
+        finally:
+            self.office_table.setUpdatesEnabled(True)
+        self.handle_office_selection()
+        
+    def _update_office_cache(self, office_id, office_data):
+        """
+        Apply this panel's own write to the loaded office list and show it.
+        
+        The list stays fresh for another OFFICE_CACHE_TTL seconds. If no
+        list is loaded, or the office is not in it, the list is reloaded.
+        
+        Args:
+            office_id (str): ID of the office written, None for a new office
+            office_data (dict): Office data written, None if the office was deleted
+        """
+        if self._office_cache is None:
+            self.refresh_data(force=True)
+            return
+            
+        if office_id is None:
+            self._office_cache.append(office_data)
+        else:
+            for index, office in enumerate(self._office_cache):
+                if office.get('office_id') == office_id:
+                    break
+            else:
+                self.refresh_data(force=True)
+                return
                 
-                show_row = text_match
+            if office_data is None:
+                del self._office_cache[index]
+            else:
+                self._office_cache[index] = office_data
                 
-            # Show/hide row
-            self.office_table.setRowHidden(row, not show_row)
-            
+        self._office_cache_ts = time.monotonic()
+        self._show_offices(self._office_cache)
+        
+    def apply_filters(self):
+        """Apply filters to the office table."""
+        self._filter_timer.stop()
+        
+        # "All ..." choices and empty search match everything
+        building = self.building_filter.currentText()
+        status = self.status_filter.currentText()
+        self.office_proxy.set_filters(
+            "" if building in ("All Buildings", "") else building,
+            "" if status == "All Statuses" else status,
+            self.search_input.text()
+        )
+        
     def handle_office_selection(self):
         """Handle office selection in the table."""
-        selected_items = self.office_table.selectedItems()
-        
         # Enable/disable buttons
-        has_selection = len(selected_items) > 0
+        has_selection = self.office_table.selectionModel().hasSelection()
         self.edit_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
         
+    def get_selected_office(self):
+        """
+        Get the currently selected office.
+        
+        Returns:
+            dict: Office data, or None if no office is selected
+        """
+        selected_rows = self.office_table.selectionModel().selectedRows()
+        if not selected_rows:
+            return None
+        return selected_rows[0].data(Qt.ItemDataRole.UserRole)
+        
     def add_office(self):
         """Add a new office."""
         self.logger.info("Adding new office")
@@ -434,6 +612,7 @@ class OfficeManagerPanel(QWidget):
             
             try:
                 # Add to database
+                office_data['last_updated'] = datetime.now().isoformat()
                 success = self.db_manager.add_office(office_data)
                 
                 if not success:
@@ -446,15 +625,15 @@ class OfficeManagerPanel(QWidget):
                     
                 self.logger.info(f"Office added: {office_data.get('office_id')}")
                 
-                # Add audit log
-                self.db_manager.add_audit_log({
+                # Queue audit log
+                self.audit_batcher.enqueue({
                     'action': 'add_office',
                     'user_id': 'admin',  # Should be replaced with actual admin ID
                     'details': f"Added office: {office_data.get('name')} ({office_data.get('office_id')})"
                 })
                 
-                # Refresh office data
-                self.refresh_data()
+                # Show the new office without reloading the list
+                self._update_office_cache(None, office_data)
                 
                 # Show success message
                 QMessageBox.information(self, "Add Office", "Office added successfully.")
@@ -469,13 +648,9 @@ class OfficeManagerPanel(QWidget):
                 
     def edit_office(self):
         """Edit selected office."""
-        selected_items = self.office_table.selectedItems()
-        if not selected_items:
+        office = self.get_selected_office()
+        if not office:
             return
-            
-        # Get office data
-        row = selected_items[0].row()
-        office = self.office_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         
         self.logger.info(f"Editing office: {office.get('office_id')}")
         
@@ -487,6 +662,7 @@ class OfficeManagerPanel(QWidget):
             
             try:
                 # Update in database
+                office_data['last_updated'] = datetime.now().isoformat()
                 success = self.db_manager.update_office(office.get('office_id'), office_data)
                 
                 if not success:
@@ -499,15 +675,15 @@ class OfficeManagerPanel(QWidget):
                     
                 self.logger.info(f"Office updated: {office.get('office_id')}")
                 
-                # Add audit log
-                self.db_manager.add_audit_log({
+                # Queue audit log
+                self.audit_batcher.enqueue({
                     'action': 'edit_office',
                     'user_id': 'admin',  # Should be replaced with actual admin ID
                     'details': f"Updated office: {office_data.get('name')} ({office.get('office_id')})"
                 })
                 
-                # Refresh office data
-                self.refresh_data()
+                # Show the changes without reloading the list
+                self._update_office_cache(office.get('office_id'), office_data)
                 
                 # Show success message
                 QMessageBox.information(self, "Edit Office", "Office updated successfully.")
@@ -522,13 +698,9 @@ class OfficeManagerPanel(QWidget):
                 
     def delete_office(self):
         """Delete selected office."""
-        selected_items = self.office_table.selectedItems()
-        if not selected_items:
+        office = self.get_selected_office()
+        if not office:
             return
-            
-        # Get office data
-        row = selected_items[0].row()
-        office = self.office_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         
         self.logger.info(f"Deleting office: {office.get('office_id')}")
         
@@ -552,15 +724,15 @@ class OfficeManagerPanel(QWidget):
                     
                 self.logger.info(f"Office deleted: {office.get('office_id')}")
                 
-                # Add audit log
-                self.db_manager.add_audit_log({
+                # Queue audit log
+                self.audit_batcher.enqueue({
                     'action': 'delete_office',
                     'user_id': 'admin',  # Should be replaced with actual admin ID
                     'details': f"Deleted office: {office.get('name')} ({office.get('office_id')})"
                 })
                 
-                # Refresh office data
-                self.refresh_data()
+                # Remove the office without reloading the list
+                self._update_office_cache(office.get('office_id'), None)
                 
                 # Show success message
                 QMessageBox.information(self, "Delete Office", "Office deleted successfully.")
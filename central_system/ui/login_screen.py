@@ -16,6 +16,7 @@ from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QSize
 from PyQt6.QtGui import QFont, QPixmap, QIcon
 
 from hardware.rfid_reader import HybridRFIDReader
+from utils.config import env_bool
 from ui.main_dashboard import MainDashboard
 from ui.admin_interface import AdminInterface
 from utils.logger import get_logger
@@ -60,7 +61,7 @@ class LoginScreen(QWidget):
         self.setMinimumSize(800, 600)
         
         # Check if touchscreen mode is enabled
-        is_touchscreen = os.getenv("TOUCHSCREEN_ENABLED", "False").lower() == "true"
+        is_touchscreen = env_bool("TOUCHSCREEN_ENABLED")
         
         # Main layout
         main_layout = QVBoxLayout()
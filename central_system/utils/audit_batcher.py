@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ConsultEase - Audit Log Batcher
+
+This module collects audit log entries and writes them to the database
+in batches instead of one round-trip per entry.
+"""
+
+import collections
+from datetime import datetime
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from utils.logger import get_logger
+
+class AuditLogBatcher(QObject):
+    """
+    Queue for audit log entries, flushed to the database in bulk.
+    
+    Entries are written when the queue reaches max_batch entries or when
+    interval_ms has passed since the first queued entry, whichever comes
+    first. Call flush() before shutting down so queued entries are not lost.
+    
+    The batcher is not thread-safe: enqueue() and flush() must be called
+    from the thread that owns it (the GUI thread), since they start and
+    stop its timer.
+    
+    Signals:
+        flushed (int): Emitted with the number of entries written by a flush
+    """
+    flushed = pyqtSignal(int)
+    
+    def __init__(self, db_manager, max_batch=100, interval_ms=250, parent=None):
+        """
+        Initialize the audit log batcher.
+        
+        Args:
+            db_manager: Database manager instance
+            max_batch (int, optional): Queue length that triggers an immediate flush
+            interval_ms (int, optional): Longest time an entry waits before being written
+            parent (QObject, optional): Parent object
+        """
+        super().__init__(parent)
+        self.logger = get_logger(__name__)
+        self.db_manager = db_manager
+        self.max_batch = max_batch
+        
+        self._queue = collections.deque()
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(interval_ms)
+        self._flush_timer.timeout.connect(self.flush)
+    
+    def enqueue(self, log_data):
+        """
+        Queue an audit log entry for writing.
+        
+        Args:
+            log_data (dict): Log data
+        """
+        # Stamp the entry now, not when the batch is written
+        log_data.setdefault('timestamp', datetime.now().isoformat())
+        
+        self._queue.append(log_data)
+        
+        if len(self._queue) >= self.max_batch:
+            self.flush()
+        elif not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def flush(self):
+        """
+        Write all queued entries to the database.
+        
+        Returns:
+            int: Number of entries written
+        """
+        self._flush_timer.stop()
+        
+        if not self._queue:
+            return 0
+        batch = list(self._queue)
+        self._queue.clear()
+        
+        log_ids = self.db_manager.add_audit_logs_bulk(batch)
+        written = sum(1 for log_id in log_ids if log_id)
+        if written < len(batch):
+            self.logger.error(f"Failed to write {len(batch) - written} of {len(batch)} audit log entries")
+        if written:
+            self.flushed.emit(written)
+            
+        return written
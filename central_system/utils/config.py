@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ConsultEase - Configuration Utility
+
+This module provides typed access to settings read from the environment.
+"""
+
+import os
+import functools
+
+@functools.lru_cache(maxsize=None)
+def env_bool(name, default=False):
+    """
+    Read a boolean setting from the environment.
+
+    Each setting is parsed once and the result reused, so this must not be
+    called before the .env file has been loaded in main().
+
+    Args:
+        name (str): Environment variable name
+        default (bool, optional): Value used when the variable is not set. Defaults to False.
+
+    Returns:
+        bool: True if the variable is "true" (case-insensitive), False otherwise
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() == "true"
@@ -15,6 +15,7 @@ from PyQt6.QtCore import QObject, pyqtSignal, QTimer, Qt
 from PyQt6.QtWidgets import QApplication, QLineEdit, QTextEdit, QWidget
 
 from utils.logger import get_logger
+from utils.config import env_bool
 
 class KeyboardHandler(QObject):
     """
@@ -37,8 +38,8 @@ class KeyboardHandler(QObject):
         self.logger = get_logger(__name__)
         
         # Check if keyboard is enabled in config
-        self.enabled = os.getenv("KEYBOARD_ENABLED", "False").lower() == "true"
-        self.auto_popup = os.getenv("KEYBOARD_AUTO_POPUP", "True").lower() == "true"
+        self.enabled = env_bool("KEYBOARD_ENABLED")
+        self.auto_popup = env_bool("KEYBOARD_AUTO_POPUP", True)
         self.keyboard_type = os.getenv("KEYBOARD_TYPE", "squeekboard").lower()
         
         # Get platform
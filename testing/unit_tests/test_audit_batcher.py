@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ConsultEase - Audit Log Batcher Unit Tests
+
+This module tests the audit log batcher, including:
+- Flushing when the queue reaches its batch size
+- Reporting the number of entries written
+- Logging partially failed batches
+- Marking the admin interface's audit log panel dirty after a flush
+"""
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path to allow importing from central_system;
+# central_system modules import each other from the central_system directory
+import sys
+import pathlib
+parent_dir = str(pathlib.Path(__file__).parent.parent.parent)
+for path in (parent_dir, str(pathlib.Path(parent_dir) / 'central_system')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Widgets are created without a display
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+
+from central_system.utils.audit_batcher import AuditLogBatcher
+from central_system.ui.admin_interface import AdminInterface, PANEL_COLLECTIONS
+
+
+class TestAuditLogBatcher(unittest.TestCase):
+    """Test cases for the audit log batcher."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application the batcher's timer needs."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set up the test environment."""
+        # Mock database manager; every entry is written by default
+        self.mock_db = MagicMock()
+        self.mock_db.add_audit_logs_bulk.side_effect = lambda logs: [f"log{i}" for i in range(len(logs))]
+        
+        self.batcher = AuditLogBatcher(self.mock_db, max_batch=3)
+        
+        # Track flushed signal
+        self.flushed_counts = []
+        self.batcher.flushed.connect(self.flushed_counts.append)
+
+    def test_enqueue_below_batch_size_waits(self):
+        """Test that entries below the batch size wait for the timer."""
+        self.batcher.enqueue({'action': 'login'})
+        self.batcher.enqueue({'action': 'logout'})
+        
+        # Verify nothing was written yet and the flush timer is running
+        self.mock_db.add_audit_logs_bulk.assert_not_called()
+        self.assertTrue(self.batcher._flush_timer.isActive())
+
+    def test_enqueue_flushes_at_batch_size(self):
+        """Test that reaching max_batch entries writes them at once."""
+        for action in ('add_faculty', 'edit_faculty', 'delete_faculty'):
+            self.batcher.enqueue({'action': action})
+            
+        # Verify one bulk write with all three entries, stamped with a timestamp
+        self.mock_db.add_audit_logs_bulk.assert_called_once()
+        batch = self.mock_db.add_audit_logs_bulk.call_args[0][0]
+        self.assertEqual([log['action'] for log in batch], ['add_faculty', 'edit_faculty', 'delete_faculty'])
+        self.assertTrue(all('timestamp' in log for log in batch))
+        
+        # Verify the timer was stopped
+        self.assertFalse(self.batcher._flush_timer.isActive())
+
+    def test_flush_emits_written_count(self):
+        """Test that flush() emits and returns the number of entries written."""
+        self.batcher.enqueue({'action': 'login'})
+        self.batcher.enqueue({'action': 'logout'})
+        
+        written = self.batcher.flush()
+        
+        self.assertEqual(written, 2)
+        self.assertEqual(self.flushed_counts, [2])
+
+    def test_flush_partial_failure_is_logged(self):
+        """Test that entries the database failed to write are logged and not counted."""
+        self.mock_db.add_audit_logs_bulk.side_effect = lambda logs: ['log1', None]
+        self.batcher.logger = MagicMock()
+        
+        self.batcher.enqueue({'action': 'login'})
+        self.batcher.enqueue({'action': 'logout'})
+        written = self.batcher.flush()
+        
+        # Verify only the written entry was reported and the failure was logged
+        self.assertEqual(written, 1)
+        self.assertEqual(self.flushed_counts, [1])
+        self.batcher.logger.error.assert_called_once()
+        self.assertIn("1 of 2", self.batcher.logger.error.call_args[0][0])
+
+    def test_flush_empty_queue(self):
+        """Test that flushing an empty queue writes nothing."""
+        written = self.batcher.flush()
+        
+        self.assertEqual(written, 0)
+        self.mock_db.add_audit_logs_bulk.assert_not_called()
+        self.assertEqual(self.flushed_counts, [])
+
+
+
+class TestAdminInterfaceAuditWiring(unittest.TestCase):
+    """Test cases for the admin interface's use of its audit log batcher."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application the admin window needs."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.mock_db = MagicMock()
+        self.mock_db.add_audit_logs_bulk.side_effect = lambda logs: [f"log{i}" for i in range(len(logs))]
+        
+        # Panels are not built; only the batcher wiring in __init__ is under test
+        with patch.object(AdminInterface, 'init_ui'):
+            self.interface = AdminInterface(self.mock_db, MagicMock(), {'username': 'admin'})
+        self.interface._dirty = [False] * 5
+
+    def tearDown(self):
+        """Clean up after the test."""
+        self.interface.deleteLater()
+
+    def test_flush_marks_audit_log_dirty(self):
+        """Test that a flush reaches _mark_audit_log_dirty through flushed."""
+        audit_index = PANEL_COLLECTIONS['audit_log']
+        
+        self.interface.audit_batcher.enqueue({'action': 'login'})
+        self.assertFalse(self.interface._dirty[audit_index])
+        
+        self.interface.audit_batcher.flush()
+        
+        # Verify only the audit log panel was marked
+        self.assertTrue(self.interface._dirty[audit_index])
+        self.assertEqual(sum(self.interface._dirty), 1)
+
+    def test_empty_flush_leaves_audit_log_clean(self):
+        """Test that flushing nothing does not mark the audit log panel."""
+        self.interface.audit_batcher.flush()
+        
+        self.assertFalse(any(self.interface._dirty))
+
+
+if __name__ == '__main__':
+    unittest.main()
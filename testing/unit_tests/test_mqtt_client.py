@@ -13,6 +13,7 @@ This module tests the MQTT client functionality, including:
 import os
 import time
 import json
+import uuid
 import unittest
 import tempfile
 from unittest.mock import MagicMock, patch, call
@@ -283,6 +284,57 @@ class TestMQTTClient(unittest.TestCase):
         # Verify return value
         self.assertTrue(result)
 
+    def _published_json(self):
+        """Decode the JSON payload of the last client.publish call."""
+        payload = self.mock_client.publish.call_args[0][1]
+        if isinstance(payload, bytes):
+            payload = payload.decode('utf-8')
+        return json.loads(payload)
+
+    def test_publish_dict_payload(self):
+        """Test that a dict payload is published as JSON."""
+        # Set connected state
+        self.mqtt_client.connected = True
+        self.mock_client.publish.return_value = MagicMock(rc=0)
+        
+        # Call publish with a dict
+        result = self.mqtt_client.publish('test/topic', {'status': 'available', 'count': 2}, qos=1)
+        
+        # Verify the payload reached the client as JSON
+        self.mock_client.publish.assert_called_once()
+        self.assertEqual(self._published_json(), {'status': 'available', 'count': 2})
+        self.assertEqual(self.mock_client.publish.call_args[0][2:], (1, False))
+        self.assertTrue(result)
+
+    def test_publish_list_payload(self):
+        """Test that a list payload is published as JSON."""
+        # Set connected state
+        self.mqtt_client.connected = True
+        self.mock_client.publish.return_value = MagicMock(rc=0)
+        
+        # Call publish with a list
+        result = self.mqtt_client.publish('test/topic', [{'id': 'faculty001'}, {'id': 'faculty002'}])
+        
+        # Verify the payload reached the client as JSON
+        self.assertEqual(self._published_json(), [{'id': 'faculty001'}, {'id': 'faculty002'}])
+        self.assertTrue(result)
+
+    def test_publish_payload_fallback_stringifies_values(self):
+        """Test that the json fallback stringifies datetime and UUID values."""
+        # Set connected state
+        self.mqtt_client.connected = True
+        self.mock_client.publish.return_value = MagicMock(rc=0)
+        
+        timestamp = datetime(2024, 1, 2, 3, 4, 5)
+        request_id = uuid.UUID('12345678-1234-5678-1234-567812345678')
+        
+        # Force the stdlib json path
+        with patch('central_system.data.mqtt_client.ORJSON_AVAILABLE', False):
+            self.mqtt_client.publish('test/topic', {'timestamp': timestamp, 'id': request_id})
+        
+        # Verify values were serialized with str()
+        self.assertEqual(self._published_json(), {'timestamp': str(timestamp), 'id': str(request_id)})
+
     def test_publish_when_disconnected(self):
         """Test publishing message when disconnected (should queue the message)."""
         # Set disconnected state